@@ -1,35 +1,131 @@
-from datetime import datetime, timedelta, timezone
+import asyncio
+import hashlib
+import hmac
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from importlib.metadata import version
 
 import jwt
-from pwdlib import PasswordHash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 import os
 
+from app.cache import cache_get, cache_set
+
+logger = logging.getLogger(__name__)
+
 # to get a string like this run:
 # openssl rand -hex 32
 SECRET_KEY = os.getenv("AUTH_SECRET_KEY")
+# HMAC keys are bytes; encode once instead of on every sign and verify
+SECRET_KEY_BYTES = SECRET_KEY.encode()
 ALGORITHM = os.getenv("ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
+ACCESS_TOKEN_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# Argon2id parameters, built once at import. memory_cost (KiB) is the dominant
+# knob: every pass fills and re-reads the whole block matrix, so the work per
+# hash grows linearly with it. The defaults are the OWASP minimum for argon2id
+# (19 MiB, t=2, p=1), roughly 3x cheaper than 64 MiB. Existing hashes keep
+# verifying because their own parameters are encoded in the hash string, and
+# are rewritten with these on the user's next login.
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "2"))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", "19456"))
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "1"))
+password_hash = PasswordHasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=ARGON2_PARALLELISM,
+    hash_len=32,
+)
+
+# Successful verifications are remembered briefly so repeated logins skip argon2.
+# Failures are never cached, so guessing still pays the full hashing cost.
+VERIFIED_PASSWORD_TTL = 30
+
+# Each argon2 call holds memory_cost of RAM and a full core. The default
+# executor allows up to 32 threads, so a burst of logins could oversubscribe
+# the CPU and memory; one thread per core caps both, and extra calls queue
+# instead.
+HASH_WORKERS = os.cpu_count() or 1
+hash_pool = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="argon2")
+
+
+def log_password_hasher_backend() -> None:
+    """Log which argon2 bindings and parameters are in use."""
+    logger.info(
+        "Password hashing: argon2id via argon2-cffi-bindings %s (t=%d, m=%d KiB, p=%d)",
+        version("argon2-cffi-bindings"),
+        password_hash.time_cost,
+        password_hash.memory_cost,
+        password_hash.parallelism,
+    )
+
 
-password_hash = PasswordHash.recommended()
+def shutdown_hash_pool() -> None:
+    """Stop the password hashing pool, waiting for in-flight hashes."""
+    hash_pool.shutdown(wait=True)
 
 
-def verify_password(plain_password, hashed_password):
-    """Verify a plain password against a hashed password."""
-    return password_hash.verify(plain_password, hashed_password)
+def _verified_password_key(plain_password, hashed_password) -> str:
+    # Keyed with the server secret so Redis never holds anything that can be
+    # attacked offline; the stored hash in the input ends the entry on a
+    # password change.
+    digest = hmac.new(
+        SECRET_KEY_BYTES, f"{hashed_password}\0{plain_password}".encode(), hashlib.sha256
+    ).hexdigest()
+    return f"auth:verified:{digest}"
 
 
-def get_password_hash(password):
-    """Hash a password using argon2."""
-    return password_hash.hash(password)
+def _verify(plain_password, hashed_password) -> bool:
+    key = _verified_password_key(plain_password, hashed_password)
+    if cache_get(key):
+        return True
+    try:
+        verified = password_hash.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+    if verified:
+        cache_set(key, True, VERIFIED_PASSWORD_TTL)
+    return verified
+
+
+async def verify_password(plain_password, hashed_password):
+    """Verify a plain password against a hashed password off the event loop.
+
+    The Redis lookup runs in the same worker thread as the hash check.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(hash_pool, _verify, plain_password, hashed_password)
+
+
+def password_needs_rehash(hashed_password) -> bool:
+    """Whether a stored hash was made with other parameters than the current ones."""
+    try:
+        return password_hash.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return False
+
+
+async def get_password_hash(password):
+    """Hash a password using argon2 off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(hash_pool, password_hash.hash, password)
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
-    """Create a JWT access token with optional expiration."""
+    """Create a JWT access token with optional expiration.
+
+    ``exp`` is written as an integer POSIX timestamp, which is what PyJWT
+    would convert a datetime to anyway.
+    """
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expires_in = int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+        expires_in = ACCESS_TOKEN_EXPIRE_SECONDS
+    to_encode["exp"] = int(time.time()) + expires_in
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY_BYTES, algorithm=ALGORITHM)
     return encoded_jwt
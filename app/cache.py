@@ -0,0 +1,63 @@
+import logging
+import os
+from typing import Any
+
+import orjson
+import redis
+
+logger = logging.getLogger(__name__)
+
+# Shared response cache. Caching is off unless REDIS_URL is set, so local
+# development and single-process deployments work without a Redis server.
+REDIS_URL = os.getenv("REDIS_URL")
+DEFAULT_TTL = 3600
+
+SHELTER_SETTINGS_KEY = "shelter:settings"
+SHELTER_LOGO_KEY = "shelter:logo"
+ANIMALS_LIST_KEY = "animals:list"
+ADOPTIONS_LIST_KEY = "adoptions:list"
+CONTACT_LIST_KEY = "contact:list"
+
+# Lists change with every write to their table, so they expire sooner than items
+LIST_TTL = 60
+ITEM_TTL = 300
+
+
+def animal_key(animal_id: int) -> str:
+    """Cache key for a single animal."""
+    return f"animals:item:{animal_id}"
+
+
+_redis = redis.Redis.from_url(REDIS_URL, socket_timeout=0.5) if REDIS_URL else None
+
+
+def cache_get(key: str) -> Any | None:
+    """Return the cached JSON value for key, or None on a miss or Redis error."""
+    if _redis is None:
+        return None
+    try:
+        raw = _redis.get(key)
+    except redis.RedisError:
+        logger.warning("Redis GET %s failed", key, exc_info=True)
+        return None
+    return orjson.loads(raw) if raw is not None else None
+
+
+def cache_set(key: str, value: Any, ttl: int = DEFAULT_TTL) -> None:
+    """Store a JSON-serializable value; the TTL bounds staleness across workers."""
+    if _redis is None:
+        return
+    try:
+        _redis.set(key, orjson.dumps(value), ex=ttl)
+    except redis.RedisError:
+        logger.warning("Redis SET %s failed", key, exc_info=True)
+
+
+def cache_delete(*keys: str) -> None:
+    """Invalidate keys after the underlying data changes."""
+    if _redis is None:
+        return
+    try:
+        _redis.delete(*keys)
+    except redis.RedisError:
+        logger.warning("Redis DELETE %s failed", keys, exc_info=True)
@@ -1,5 +1,6 @@
+import asyncio
 from typing import List
-from fastapi import APIRouter, HTTPException, UploadFile, File, status
+from fastapi import APIRouter, HTTPException, Request, UploadFile, File, status
 from pydantic import BaseModel
 from app.cloudinary_config import upload_media, delete_media
 from app.dependencies import AdminUser
@@ -9,6 +10,24 @@ router = APIRouter(
     tags=["media"],
 )
 
+VIDEO_PREFIX = "video/"
+
+# Accepted MIME types mapped to their Cloudinary resource type
+RESOURCE_TYPES = {
+    mime: "video" if mime.startswith(VIDEO_PREFIX) else "image"
+    for mime in (
+        "image/jpeg", "image/png", "image/gif", "image/webp",
+        "video/mp4", "video/quicktime", "video/x-msvideo"
+    )
+}
+
+# Largest single file accepted for upload
+MAX_UPLOAD = 50 * 1024 * 1024
+
+# Cap concurrent Cloudinary uploads per worker to stay within account rate limits
+MAX_CONCURRENT_UPLOADS = 4
+_upload_slots = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+
 
 class MediaUploadResponse(BaseModel):
     """Response model for media upload."""
@@ -27,6 +46,31 @@ class MediaDeleteRequest(BaseModel):
     resource_type: str = "image"  # 'image' or 'video'
 
 
+def resolve_resource_type(file: UploadFile, detail: str) -> str:
+    """Return the Cloudinary resource type for an allowed upload, or raise 400."""
+    resource_type = RESOURCE_TYPES.get(file.content_type)
+    if resource_type is None:
+        raise HTTPException(status_code=400, detail=detail)
+    return resource_type
+
+
+def check_upload_size(file: UploadFile, size: int | None = None) -> None:
+    """Raise 413 when a file is over MAX_UPLOAD, before it is sent anywhere."""
+    if (size or file.size or 0) > MAX_UPLOAD:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File '{file.filename}' is too large. Maximum size is {MAX_UPLOAD // (1024 * 1024)} MB"
+        )
+
+
+def declared_content_length(request: Request) -> int:
+    """Return the request's Content-Length, or 0 when absent; 400 when it is not a number."""
+    try:
+        return int(request.headers.get("content-length", "0"))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid Content-Length header")
+
+
 @router.post(
     "/upload",
     status_code=status.HTTP_201_CREATED,
@@ -36,6 +80,7 @@ class MediaDeleteRequest(BaseModel):
     responses={
         201: {"description": "Media uploaded successfully"},
         400: {"description": "Invalid file format"},
+        413: {"description": "File too large"},
         401: {"description": "Not authenticated"},
         403: {"description": "Admin privileges required"},
         500: {"description": "Upload failed"}
@@ -43,26 +88,19 @@ class MediaDeleteRequest(BaseModel):
 )
 async def upload_media_file(
     admin: AdminUser,
+    request: Request,
     file: UploadFile = File(..., description="Image or video file to upload")
 ):
     """
     Upload an image or video to Cloudinary.
     Automatically detects file type and optimizes accordingly.
     """
-    # Validate file type
-    allowed_types = [
-        "image/jpeg", "image/png", "image/gif", "image/webp",
-        "video/mp4", "video/quicktime", "video/x-msvideo"
-    ]
-    
-    if file.content_type not in allowed_types:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid file type. Allowed: images (jpg, png, gif, webp) and videos (mp4, mov, avi)"
-        )
-    
-    # Determine resource type
-    resource_type = "video" if file.content_type.startswith("video/") else "image"
+    # Validate file type and determine resource type in one lookup
+    resource_type = resolve_resource_type(
+        file,
+        "Invalid file type. Allowed: images (jpg, png, gif, webp) and videos (mp4, mov, avi)"
+    )
+    check_upload_size(file, file.size or declared_content_length(request))
     
     # Upload to Cloudinary
     result = await upload_media(file, folder="pawscout/animals", resource_type=resource_type)
@@ -79,6 +117,7 @@ async def upload_media_file(
     responses={
         201: {"description": "All media uploaded successfully"},
         400: {"description": "Invalid file format in one or more files"},
+        413: {"description": "One or more files too large"},
         401: {"description": "Not authenticated"},
         403: {"description": "Admin privileges required"},
         500: {"description": "Upload failed"}
@@ -95,29 +134,25 @@ async def upload_multiple_media(
     if len(files) > 10:
         raise HTTPException(status_code=400, detail="Maximum 10 files per upload")
     
-    results = []
+    prepared = []
     
+    # Validate every file before starting any upload
     for file in files:
-        # Validate file type
-        allowed_types = [
-            "image/jpeg", "image/png", "image/gif", "image/webp",
-            "video/mp4", "video/quicktime", "video/x-msvideo"
-        ]
-        
-        if file.content_type not in allowed_types:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid file type in '{file.filename}'. Allowed: images and videos"
-            )
-        
-        # Determine resource type
-        resource_type = "video" if file.content_type.startswith("video/") else "image"
-        
-        # Upload to Cloudinary
-        result = await upload_media(file, folder="pawscout/animals", resource_type=resource_type)
-        results.append(MediaUploadResponse(**result))
+        resource_type = resolve_resource_type(
+            file,
+            f"Invalid file type in '{file.filename}'. Allowed: images and videos"
+        )
+        check_upload_size(file)
+        prepared.append((file, resource_type))
+    
+    async def upload_one(file: UploadFile, resource_type: str):
+        async with _upload_slots:
+            return await upload_media(file, folder="pawscout/animals", resource_type=resource_type)
+    
+    # Upload to Cloudinary concurrently
+    results = await asyncio.gather(*(upload_one(f, rt) for f, rt in prepared))
     
-    return results
+    return [MediaUploadResponse(**result) for result in results]
 
 
 @router.delete(
@@ -1,7 +1,10 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import cloudinary
 import cloudinary.uploader
 import cloudinary.api
-from cloudinary.utils import cloudinary_url
+from cloudinary.utils import cloudinary_url, get_http_connector
 import os
 from typing import Dict, Any
 from fastapi import HTTPException, UploadFile
@@ -14,6 +17,58 @@ cloudinary.config(
     secure=True
 )
 
+# The SDK keeps one module-level urllib3 pool for uploads, but it is built at
+# import time with a single connection per host, so concurrent uploads keep
+# discarding sockets and paying for new TLS handshakes. Rebuild it once with
+# room for parallel uploads so keep-alive connections are reused.
+UPLOAD_CONNECTIONS = 8
+cloudinary.uploader._http = get_http_connector(
+    cloudinary.config(),
+    {**cloudinary.CERT_KWARGS, "maxsize": UPLOAD_CONNECTIONS}
+)
+
+# Videos and any file larger than one chunk are sent with chunked uploads so
+# only one chunk is held in memory at a time
+LARGE_UPLOAD_CHUNK_SIZE = 6_000_000
+
+# Blocking SDK calls run on a dedicated pool sized to the HTTP pool above, so
+# slow uploads don't starve the default executor used by the rest of the app.
+upload_pool = ThreadPoolExecutor(max_workers=UPLOAD_CONNECTIONS, thread_name_prefix="cld")
+
+# Delivery transformation applied to every image upload
+_TX = [{"quality": "auto", "fetch_format": "auto"}]
+
+# Leading bytes of the image formats we accept, used to check that an upload
+# really is what its Content-Type claims before paying for a Cloudinary call
+IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+SNIFF_BYTES = 16
+
+
+def sniff_image_type(head: bytes) -> str | None:
+    """Return the image MIME type matching the file's leading bytes, if any."""
+    for signature, mime in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return mime
+    # WebP is a RIFF container: "RIFF" <size> "WEBP"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+async def _run_in_pool(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(upload_pool, functools.partial(func, *args, **kwargs))
+
+
+def shutdown_upload_pool() -> None:
+    """Stop the Cloudinary worker pool, waiting for in-flight calls."""
+    upload_pool.shutdown(wait=True)
+
 
 async def upload_media(
     file: UploadFile,
@@ -32,18 +87,25 @@ async def upload_media(
         Dictionary with upload result including secure_url and public_id
     """
     try:
-        # Read file contents
-        contents = await file.read()
+        # Stream the spooled upload straight to Cloudinary in a worker thread
+        await file.seek(0)
+        options = {"folder": folder, "resource_type": resource_type}
+        if resource_type != "video":
+            options["transformation"] = _TX
         
-        # Upload to Cloudinary
-        upload_result = cloudinary.uploader.upload(
-            contents,
-            folder=folder,
-            resource_type=resource_type,
-            transformation=[
-                {"quality": "auto", "fetch_format": "auto"}
-            ] if resource_type in ["image", "auto"] else None
-        )
+        if resource_type == "video" or (file.size or 0) > LARGE_UPLOAD_CHUNK_SIZE:
+            upload_result = await _run_in_pool(
+                cloudinary.uploader.upload_large,
+                file.file,
+                chunk_size=LARGE_UPLOAD_CHUNK_SIZE,
+                **options
+            )
+        else:
+            upload_result = await _run_in_pool(
+                cloudinary.uploader.upload,
+                file.file,
+                **options
+            )
         
         return {
             "url": upload_result["secure_url"],
@@ -71,7 +133,11 @@ async def delete_media(public_id: str, resource_type: str = "image") -> Dict[str
         Dictionary with deletion result
     """
     try:
-        result = cloudinary.uploader.destroy(public_id, resource_type=resource_type)
+        result = await _run_in_pool(
+            cloudinary.uploader.destroy,
+            public_id,
+            resource_type=resource_type
+        )
         
         if result.get("result") != "ok":
             raise HTTPException(status_code=404, detail="Media not found or already deleted")
@@ -82,9 +148,13 @@ async def delete_media(public_id: str, resource_type: str = "image") -> Dict[str
         raise HTTPException(status_code=500, detail=f"Delete failed: {str(e)}")
 
 
+@functools.lru_cache(maxsize=4096)
 def get_optimized_url(public_id: str, width: int = 800, height: int = 600) -> str:
     """
     Generate an optimized URL for an image.
+
+    The URL depends only on the arguments and the Cloudinary config loaded at
+    import, so results are memoized.
     
     Args:
         public_id: The public_id of the image
@@ -1,9 +1,17 @@
+import logging
 from typing import Annotated
 from dotenv import load_dotenv
+from sqlalchemy import Index, func, select, text
+from sqlalchemy.schema import AddConstraint, CreateIndex
 from sqlmodel import SQLModel, Session, create_engine
 from fastapi import Depends
 import os
 
+import app.models  # noqa: F401  (registers every table on SQLModel.metadata)
+from app.models.settings import SHELTER_SETTINGS_ID, ShelterSettings
+
+logger = logging.getLogger(__name__)
+
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -11,23 +19,177 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is not set in environment variables")
 
-engine = create_engine(DATABASE_URL, echo=True)
+# Every gunicorn worker owns a pool, so the worst case is
+# workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections; keep that under the
+# server's max_connections (or put pgbouncer in front).
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "5"))
+
+# Statement logging is expensive on every query; opt in with SQL_ECHO=1
+engine = create_engine(
+    DATABASE_URL,
+    echo=os.getenv("SQL_ECHO") == "1",
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
+
+
+# Every worker runs the schema setup at startup; this advisory lock makes
+# them take turns so two workers never race on the same CREATE
+SCHEMA_LOCK_KEY = 0x5041_5753  # "PAWS"
+
+# Indexes added to models after their tables first shipped. create_all skips
+# tables that already exist, so these are created with IF NOT EXISTS on
+# every start; once present the statements are no-ops.
+INDEX_UPGRADES = ("ix_pawuser_admin", "ix_animal_type_status_id", "ix_animal_available_id")
+
+# Unique indexes that ON CONFLICT clauses depend on but that create_all only
+# builds for new tables. The DDL comes from the index declared on the model.
+UNIQUE_INDEX_UPGRADES = ("ix_subscription_email", "ix_volunteer_phone")
+
+
+def model_index(name: str) -> Index:
+    """Return the index called ``name`` from the SQLModel metadata."""
+    for table in SQLModel.metadata.tables.values():
+        for index in table.indexes:
+            if index.name == name:
+                return index
+    raise LookupError(f"No model declares an index named {name}")
+
+
+def find_duplicate_ids(connection, index: Index) -> list[list[int]]:
+    """Ids of the rows that share a value in the index's columns, one list per value."""
+    table = index.table
+    rows = connection.execute(
+        select(func.array_agg(table.c.id)).group_by(*index.columns).having(func.count() > 1)
+    ).scalars()
+    return [sorted(ids) for ids in rows]
+
+
+def add_missing_indexes(connection) -> None:
+    """Create each non-unique index in INDEX_UPGRADES unless it already exists."""
+    for index_name in INDEX_UPGRADES:
+        connection.execute(CreateIndex(model_index(index_name), if_not_exists=True))
+
+
+def add_missing_unique_indexes(connection) -> list[str]:
+    """Create each index in UNIQUE_INDEX_UPGRADES that the database lacks.
+
+    Read-only apart from the CREATE INDEX statements: no row is ever changed
+    or deleted. An index whose columns already hold duplicate values is
+    skipped, and a description naming the duplicate ids is returned so an
+    operator can decide which rows to keep.
+    """
+    problems = []
+    for index_name in UNIQUE_INDEX_UPGRADES:
+        if connection.execute(text("SELECT to_regclass(:name)"), {"name": index_name}).scalar() is not None:
+            continue
+        index = model_index(index_name)
+        duplicates = find_duplicate_ids(connection, index)
+        if duplicates:
+            problems.append(
+                f"{index_name} not created: {index.table.name}."
+                f"{', '.join(column.name for column in index.columns)} has duplicate values in rows "
+                + "; ".join(", ".join(map(str, ids)) for ids in duplicates)
+            )
+            continue
+        connection.execute(CreateIndex(index, if_not_exists=True))
+        logger.info("Created unique index %s", index_name)
+    return problems
+
+
+def add_settings_singleton(connection) -> list[str]:
+    """Pin the shelter settings row to SHELTER_SETTINGS_ID and add its CHECK constraint.
+
+    A single legacy row stored under another id is renumbered so the handlers,
+    which only read SHELTER_SETTINGS_ID, see it again. Several rows are left
+    untouched and reported, since only an operator can tell which one is current.
+    """
+    constraint = next(
+        c for c in ShelterSettings.__table__.constraints if c.name == "shelter_settings_singleton"
+    )
+    if connection.execute(
+        text("SELECT 1 FROM pg_constraint WHERE conname = :name"), {"name": constraint.name}
+    ).first() is not None:
+        return []
+
+    ids = connection.execute(select(ShelterSettings.id).order_by(ShelterSettings.id)).scalars().all()
+    if len(ids) > 1:
+        return [
+            f"{constraint.name} not added: shelter_settings has {len(ids)} rows "
+            f"(ids {', '.join(map(str, ids))}); keep one and it will be moved to id {SHELTER_SETTINGS_ID}"
+        ]
+    if ids and ids[0] != SHELTER_SETTINGS_ID:
+        connection.execute(
+            text("UPDATE shelter_settings SET id = :new_id WHERE id = :old_id"),
+            {"new_id": SHELTER_SETTINGS_ID, "old_id": ids[0]},
+        )
+        logger.info("Moved shelter settings row %d to id %d", ids[0], SHELTER_SETTINGS_ID)
+
+    connection.execute(AddConstraint(constraint))
+    logger.info("Added constraint %s", constraint.name)
+    return []
 
 
 def create_db_and_tables() -> None:
-    """Ensure all SQLModel tables exist before serving requests."""
-    from app.routers.animals import Animal  # noqa: F401
-    from app.routers.adopt import AdoptionApplication  # noqa: F401
-    from app.routers.volunteer import Volunteer  # noqa: F401
-    from app.routers.contact import ContactMessage  # noqa: F401
-    from app.routers.users import PawUser  # noqa: F401
-    from app.models.settings import ShelterSettings  # noqa: F401
+    """Ensure all SQLModel tables and the indexes and constraints added since exist before serving requests.
+
+    Upgrades that can be applied are committed. If one needs a manual data
+    cleanup first, RuntimeError is raised afterwards so the app does not
+    start with handlers whose ON CONFLICT clauses would fail or whose
+    settings reads would miss the stored row.
+
+    Set AUTO_CREATE_SCHEMA=0 in deployments whose schema is managed
+    separately to skip the metadata introspection on every start; such
+    deployments must create the indexes in INDEX_UPGRADES and
+    UNIQUE_INDEX_UPGRADES and the settings constraint themselves.
+    """
+    if os.getenv("AUTO_CREATE_SCHEMA", "1") != "1":
+        return
+
+    with engine.begin() as connection:
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
+        SQLModel.metadata.create_all(connection)
+        add_missing_indexes(connection)
+        problems = add_missing_unique_indexes(connection)
+        problems += add_settings_singleton(connection)
+
+    if problems:
+        raise RuntimeError(
+            "Schema upgrade needs a manual cleanup; resolve these rows and restart:\n" + "\n".join(problems)
+        )
+
+
+# Keyset pagination bounds for list endpoints
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def fetch_page(session: Session, statement, id_column, after_id: int | None, limit: int | None):
+    """Fetch one keyset page of ``statement`` ordered by ``id_column``.
 
-    SQLModel.metadata.create_all(engine)
+    One extra row is requested to learn whether another page exists, so no
+    COUNT(*) is needed. Returns the rows and the cursor to pass as
+    ``after_id`` for the next page, or None when this is the last page.
+    """
+    limit = limit or DEFAULT_PAGE_SIZE
+    if after_id is not None:
+        statement = statement.where(id_column > after_id)
+    rows = session.exec(statement.order_by(id_column).limit(limit + 1)).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, getattr(rows[-1], id_column.key)
 
 
 def get_session():
-    with Session(engine) as session:
+    # Keep loaded attributes after commit so handlers can build responses
+    # without an implicit re-SELECT of every object they just wrote.
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
 
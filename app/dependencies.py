@@ -1,29 +1,127 @@
-from typing import Annotated, TYPE_CHECKING
-from fastapi import Depends, HTTPException, status
+import hashlib
+import time
+from threading import Lock
+from typing import Annotated, Literal, TypeVar
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 import jwt
 from jwt.exceptions import InvalidTokenError
-from sqlmodel import Session, select
-from app.auth import SECRET_KEY, ALGORITHM
-from app.database import get_session
-
-if TYPE_CHECKING:
-    from app.routers.users import PawUser
+from sqlalchemy import bindparam
+from sqlmodel import SQLModel, Session, select
+from app.auth import SECRET_KEY_BYTES, ALGORITHM
+from app.database import MAX_PAGE_SIZE, get_session
+from app.models.user import AuthenticatedUser, PawUser
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
+# Token verification settings are fixed, so build them once instead of per request
+_ALGORITHMS = [ALGORITHM]
+_DECODE_OPTIONS = {"require": ["exp", "sub", "user_id"]}
+
 SessionDep = Annotated[Session, Depends(get_session)]
 TokenDep = Annotated[str, Depends(oauth2_scheme)]
 
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+
+def get_or_404(session: Session, model: type[ModelT], pk: int, detail: str) -> ModelT:
+    """Load a row by primary key, or raise 404 with ``detail``.
+
+    session.get answers from the session's identity map when the row is
+    already loaded, and sessions live for one request, so repeated lookups
+    within a request cost no extra query.
+    """
+    row = session.get(model, pk)
+    if row is None:
+        raise HTTPException(status_code=404, detail=detail)
+    return row
+
+
+# Optional keyset pagination for list endpoints; when neither parameter is
+# sent the endpoint returns the full list as it always has. Every paged
+# response carries the next cursor in NEXT_CURSOR_HEADER; lists wrapped in an
+# object also repeat it as a "next_cursor" field.
+AfterId = Annotated[
+    int | None,
+    Query(ge=0, description="Return rows with id greater than this cursor. The next cursor is sent in the X-Next-Cursor header (absent on the last page) and, for object responses, as next_cursor."),
+]
+PageLimit = Annotated[int | None, Query(ge=1, le=MAX_PAGE_SIZE, description="Maximum number of rows to return")]
+
+# Full-list endpoints can stream every row as newline-delimited JSON instead
+ListFormat = Annotated[
+    Literal["json", "ndjson"],
+    Query(alias="format", description="ndjson streams every row, one JSON object per line; paging parameters are ignored"),
+]
+
+# Header carrying the next cursor for list endpoints that return a bare array
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def set_next_cursor_header(response: Response, next_cursor: int | None) -> None:
+    """Send the cursor for the following page; omitted on the last page."""
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = str(next_cursor)
+
+
+# Both auth caches below are per process. invalidate_cached_user() only
+# reaches the worker that made the change, so this TTL is how long a demoted
+# or deleted user can keep their old role on the other gunicorn workers.
+AUTH_CACHE_TTL = 5
+
+# Immutable AuthenticatedUser snapshots keyed by user_id; admin routes evict
+# users they modify via invalidate_cached_user()
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=AUTH_CACHE_TTL)
+_user_cache_lock = Lock()
 
-async def get_current_user(token: TokenDep, session: SessionDep) -> "PawUser":
+# Tokens that already passed jwt.decode, keyed by a digest of the raw token and
+# mapped to (user_id, exp). Only the id is kept, never the user's role; exp is
+# re-checked on every hit so a cached token never outlives its own expiry.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=AUTH_CACHE_TTL)
+_token_cache_lock = Lock()
+
+_STMT_AUTH_USER = select(
+    PawUser.id, PawUser.email, PawUser.name, PawUser.lastName, PawUser.isAdmin
+).where(PawUser.id == bindparam("user_id"))
+
+
+def _token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
+def _decode_user_id(token: str) -> int:
+    """Return the user_id claim of a valid token; raise InvalidTokenError otherwise."""
+    digest = _token_digest(token)
+    with _token_cache_lock:
+        cached = _token_cache.get(digest)
+    if cached is not None and cached[1] > time.time():
+        return cached[0]
+
+    # Missing sub/user_id/exp claims raise InvalidTokenError
+    payload = jwt.decode(token, SECRET_KEY_BYTES, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS)
+    user_id: int = payload["user_id"]
+    with _token_cache_lock:
+        _token_cache[digest] = (user_id, payload["exp"])
+    return user_id
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Drop a user from the authentication cache after it changes."""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
+def _load_authenticated_user(session: Session, user_id: int) -> AuthenticatedUser | None:
+    row = session.exec(_STMT_AUTH_USER, params={"user_id": user_id}).first()
+    return AuthenticatedUser.model_validate(row) if row is not None else None
+
+
+async def get_current_user(token: TokenDep, session: SessionDep) -> AuthenticatedUser:
     """
     Dependency to get the current authenticated user from JWT token.
     Validates token and retrieves user from database.
     """
-    # Import here to avoid circular import
-    from app.routers.users import PawUser
-    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -31,28 +129,28 @@ async def get_current_user(token: TokenDep, session: SessionDep) -> "PawUser":
     )
     
     try:
-        # Decode JWT token
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        user_id: int = payload.get("user_id")
-        
-        if email is None or user_id is None:
-            raise credentials_exception
-            
+        user_id = _decode_user_id(token)
     except InvalidTokenError:
         raise credentials_exception
     
-    # Get user from database
-    user = session.get(PawUser, user_id)
+    with _user_cache_lock:
+        user = _user_cache.get(user_id)
+    if user is not None:
+        return user
+
+    # Get user from database without blocking the event loop
+    user = await run_in_threadpool(_load_authenticated_user, session, user_id)
     if user is None:
         raise credentials_exception
-        
+
+    with _user_cache_lock:
+        _user_cache[user_id] = user
     return user
 
 
 async def get_current_admin_user(
-    current_user: Annotated["PawUser", Depends(get_current_user)]
-) -> "PawUser":
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)]
+) -> AuthenticatedUser:
     """
     Dependency to verify that the current user has admin privileges.
     Use this to protect admin-only endpoints.
@@ -66,5 +164,5 @@ async def get_current_admin_user(
 
 
 # Type aliases for cleaner route definitions
-CurrentUser = Annotated["PawUser", Depends(get_current_user)]
-AdminUser = Annotated["PawUser", Depends(get_current_admin_user)]
+CurrentUser = Annotated[AuthenticatedUser, Depends(get_current_user)]
+AdminUser = Annotated[AuthenticatedUser, Depends(get_current_admin_user)]
@@ -1,13 +1,18 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File, status
-from sqlmodel import select
+from fastapi import APIRouter, HTTPException, Request, Response, UploadFile, File, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import raiseload
+from sqlmodel import select, func, update, delete, or_
 from datetime import datetime
-from app.dependencies import AdminUser, SessionDep
-from app.routers.users import PawUser
-from app.routers.animals import Animal
-from app.routers.adopt import AdoptionApplication
-from app.routers.volunteer import Volunteer
-from app.cloudinary_config import upload_media, delete_media
-from app.models.settings import ShelterSettings, ShelterSettingsUpdate
+from app.database import fetch_page
+from app.dependencies import AdminUser, SessionDep, AfterId, PageLimit, set_next_cursor_header, invalidate_cached_user
+from app.models.user import PawUser, PawUserPublic
+from app.models.animal import Animal
+from app.models.adoption import AdoptionApplication, AdoptionSummary
+from app.models.volunteer import Volunteer
+from app.cloudinary_config import upload_media, delete_media, sniff_image_type, SNIFF_BYTES
+from app.responses import etag_response, stream_rows
+from app.cache import cache_get, cache_set, cache_delete, SHELTER_SETTINGS_KEY, SHELTER_LOGO_KEY
+from app.models.settings import SHELTER_SETTINGS_ID, ShelterSettings, ShelterSettingsUpdate
 
 router = APIRouter(
     prefix="/admin",
@@ -18,6 +23,71 @@ router = APIRouter(
     }
 )
 
+USER_ROLE_FIELDS = ("id", "email", "name", "isAdmin")
+
+# Accepted logo Content-Types mapped to the type sniff_image_type() reports
+LOGO_TYPES = {
+    "image/jpeg": "image/jpeg",
+    "image/jpg": "image/jpeg",
+    "image/png": "image/png",
+    "image/gif": "image/gif",
+    "image/webp": "image/webp",
+}
+
+# Statements are immutable, so the fixed ones are built once at import.
+# Full-row lists use raiseload so a future relationship can't lazy-load per row.
+_STMT_DASHBOARD_COUNTS = select(*(
+    select(func.count()).select_from(model).scalar_subquery()
+    for model in (PawUser, Animal, AdoptionApplication, Volunteer)
+))
+# Only public columns, so password hashes never leave the database
+_STMT_USERS = select(PawUser.id, PawUser.email, PawUser.name, PawUser.lastName, PawUser.isAdmin)
+_STMT_ADOPTIONS = select(AdoptionApplication).options(raiseload("*"))
+_STMT_ADOPTION_SUMMARIES = select(
+    AdoptionApplication.id,
+    AdoptionApplication.animalId,
+    AdoptionApplication.applicantName,
+    AdoptionApplication.applicantLastName,
+    AdoptionApplication.date,
+    AdoptionApplication.status
+)
+_STMT_VOLUNTEERS = select(Volunteer).options(raiseload("*"))
+
+
+def set_admin_flag(session: SessionDep, user_id: int, is_admin: bool) -> dict | None:
+    """Flip isAdmin in one UPDATE ... RETURNING, only if it actually changes.
+
+    Returns the updated user's public fields, or None when the user is missing
+    or already has the requested role.
+    """
+    row = session.exec(
+        update(PawUser)
+        .where(PawUser.id == user_id, PawUser.isAdmin == (not is_admin))
+        .values(isAdmin=is_admin)
+        .returning(PawUser.id, PawUser.email, PawUser.name, PawUser.isAdmin)
+    ).first()
+    session.commit()
+    if row is None:
+        return None
+    invalidate_cached_user(user_id)
+    return dict(zip(USER_ROLE_FIELDS, row))
+
+
+def save_logo(
+    session: SessionDep, existing_settings: ShelterSettings | None, logo_url: str, logo_public_id: str
+) -> None:
+    """Store the uploaded logo on the settings row, creating it if needed."""
+    if existing_settings:
+        existing_settings.logo_url = logo_url
+        existing_settings.logo_public_id = logo_public_id
+        existing_settings.updated_at = datetime.utcnow()
+        session.add(existing_settings)
+    else:
+        session.add(ShelterSettings(logo_url=logo_url, logo_public_id=logo_public_id))
+
+    session.commit()
+    cache_delete(SHELTER_SETTINGS_KEY, SHELTER_LOGO_KEY)
+
 
 @router.get(
     "/dashboard",
@@ -28,13 +98,12 @@ router = APIRouter(
         200: {"description": "Dashboard statistics retrieved successfully"}
     }
 )
-async def get_admin_dashboard(admin: AdminUser, session: SessionDep):
+def get_admin_dashboard(admin: AdminUser, session: SessionDep):
     """Admin dashboard with statistics overview."""
-    # Get counts
-    total_users = len(session.exec(select(PawUser)).all())
-    total_animals = len(session.exec(select(Animal)).all())
-    total_adoptions = len(session.exec(select(AdoptionApplication)).all())
-    total_volunteers = len(session.exec(select(Volunteer)).all())
+    # Get all four counts in a single round-trip
+    total_users, total_animals, total_adoptions, total_volunteers = session.exec(
+        _STMT_DASHBOARD_COUNTS
+    ).one()
     
     return {
         "message": f"Welcome to admin dashboard, {admin.name}!",
@@ -50,26 +119,27 @@ async def get_admin_dashboard(admin: AdminUser, session: SessionDep):
 @router.get(
     "/users",
     status_code=status.HTTP_200_OK,
+    response_model=list[PawUserPublic],
     summary="Get all registered users",
     description="Retrieve a list of all registered users in the system. Passwords are excluded from the response for security. Admin only.",
     responses={
         200: {"description": "List of all users (without passwords)"}
     }
 )
-async def get_all_users(admin: AdminUser, session: SessionDep):
+def get_all_users(
+    admin: AdminUser,
+    session: SessionDep,
+    response: Response,
+    after_id: AfterId = None,
+    limit: PageLimit = None
+):
     """Get all registered users. Admin only endpoint."""
-    users = session.exec(select(PawUser)).all()
-    # Don't return passwords
-    return [
-        {
-            "id": user.id,
-            "email": user.email,
-            "name": user.name,
-            "lastName": user.lastName,
-            "isAdmin": user.isAdmin
-        }
-        for user in users
-    ]
+    if after_id is None and limit is None:
+        return session.exec(_STMT_USERS).all()
+    
+    rows, next_cursor = fetch_page(session, _STMT_USERS, PawUser.id, after_id, limit)
+    set_next_cursor_header(response, next_cursor)
+    return rows
 
 
 @router.patch(
@@ -83,28 +153,18 @@ async def get_all_users(admin: AdminUser, session: SessionDep):
         404: {"description": "User not found"}
     }
 )
-async def promote_user_to_admin(user_id: int, admin: AdminUser, session: SessionDep):
+def promote_user_to_admin(user_id: int, admin: AdminUser, session: SessionDep):
     """Promote a user to admin status. Admin only endpoint."""
-    user = session.get(PawUser, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    if user.isAdmin:
+    user = set_admin_flag(session, user_id, True)
+    if user is None:
+        # Nothing was updated; a second lookup only on this path tells why
+        if session.exec(select(PawUser.id).where(PawUser.id == user_id)).first() is None:
+            raise HTTPException(status_code=404, detail="User not found")
         raise HTTPException(status_code=400, detail="User is already an admin")
     
-    user.isAdmin = True
-    session.add(user)
-    session.commit()
-    session.refresh(user)
-    
     return {
-        "message": f"User {user.email} promoted to admin successfully",
-        "user": {
-            "id": user.id,
-            "email": user.email,
-            "name": user.name,
-            "isAdmin": user.isAdmin
-        }
+        "message": f"User {user['email']} promoted to admin successfully",
+        "user": user
     }
 
 
@@ -119,32 +179,22 @@ async def promote_user_to_admin(user_id: int, admin: AdminUser, session: Session
         404: {"description": "User not found"}
     }
 )
-async def demote_admin_to_user(user_id: int, admin: AdminUser, session: SessionDep):
+def demote_admin_to_user(user_id: int, admin: AdminUser, session: SessionDep):
     """Remove admin privileges from a user. Admin only endpoint."""
-    user = session.get(PawUser, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    if not user.isAdmin:
-        raise HTTPException(status_code=400, detail="User is not an admin")
-    
     # Prevent demoting yourself
-    if user.id == admin.id:
+    if user_id == admin.id:
         raise HTTPException(status_code=400, detail="Cannot demote yourself")
     
-    user.isAdmin = False
-    session.add(user)
-    session.commit()
-    session.refresh(user)
+    user = set_admin_flag(session, user_id, False)
+    if user is None:
+        # Nothing was updated; a second lookup only on this path tells why
+        if session.exec(select(PawUser.id).where(PawUser.id == user_id)).first() is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        raise HTTPException(status_code=400, detail="User is not an admin")
     
     return {
-        "message": f"Admin privileges removed from {user.email}",
-        "user": {
-            "id": user.id,
-            "email": user.email,
-            "name": user.name,
-            "isAdmin": user.isAdmin
-        }
+        "message": f"Admin privileges removed from {user['email']}",
+        "user": user
     }
 
 
@@ -159,20 +209,22 @@ async def demote_admin_to_user(user_id: int, admin: AdminUser, session: SessionD
         404: {"description": "User not found"}
     }
 )
-async def delete_user(user_id: int, admin: AdminUser, session: SessionDep):
+def delete_user(user_id: int, admin: AdminUser, session: SessionDep):
     """Delete a user from the system. Admin only endpoint."""
-    user = session.get(PawUser, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
     # Prevent deleting yourself
-    if user.id == admin.id:
+    if user_id == admin.id:
         raise HTTPException(status_code=400, detail="Cannot delete yourself")
     
-    session.delete(user)
+    email = session.exec(
+        delete(PawUser).where(PawUser.id == user_id).returning(PawUser.email)
+    ).scalar_one_or_none()
+    if email is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    
     session.commit()
+    invalidate_cached_user(user_id)
     
-    return {"message": f"User {user.email} deleted successfully"}
+    return {"message": f"User {email} deleted successfully"}
 
 
 @router.get(
@@ -184,10 +236,46 @@ async def delete_user(user_id: int, admin: AdminUser, session: SessionDep):
         200: {"description": "List of all adoption applications"}
     }
 )
-async def get_all_adoptions(admin: AdminUser, session: SessionDep):
+def get_all_adoptions(
+    admin: AdminUser,
+    session: SessionDep,
+    response: Response,
+    after_id: AfterId = None,
+    limit: PageLimit = None
+):
     """Get all adoption applications with full details. Admin only endpoint."""
-    adoptions = session.exec(select(AdoptionApplication)).all()
-    return {"requests": adoptions}
+    if after_id is None and limit is None:
+        return stream_rows(_STMT_ADOPTIONS, key="requests")
+    
+    rows, next_cursor = fetch_page(session, _STMT_ADOPTIONS, AdoptionApplication.id, after_id, limit)
+    set_next_cursor_header(response, next_cursor)
+    return {"requests": rows, "next_cursor": next_cursor}
+
+
+@router.get(
+    "/adoptions/summary",
+    status_code=status.HTTP_200_OK,
+    response_model=list[AdoptionSummary],
+    summary="Get adoption application summaries",
+    description="Retrieve only the fields needed for the adoption list view. Use /admin/adoptions or /adopt/{application_id} for full details. Admin only.",
+    responses={
+        200: {"description": "List of adoption application summaries"}
+    }
+)
+def get_adoption_summaries(
+    admin: AdminUser,
+    session: SessionDep,
+    response: Response,
+    after_id: AfterId = None,
+    limit: PageLimit = None
+):
+    """Get a projected list of adoption applications. Admin only endpoint."""
+    if after_id is None and limit is None:
+        return session.exec(_STMT_ADOPTION_SUMMARIES).all()
+    
+    rows, next_cursor = fetch_page(session, _STMT_ADOPTION_SUMMARIES, AdoptionApplication.id, after_id, limit)
+    set_next_cursor_header(response, next_cursor)
+    return rows
 
 
 @router.get(
@@ -199,11 +287,24 @@ async def get_all_adoptions(admin: AdminUser, session: SessionDep):
         200: {"description": "List of all volunteer applications"}
     }
 )
-async def get_all_volunteers(admin: AdminUser, session: SessionDep):
+def get_all_volunteers(
+    admin: AdminUser,
+    session: SessionDep,
+    response: Response,
+    after_id: AfterId = None,
+    limit: PageLimit = None
+):
     """Get all volunteer applications. Admin only endpoint."""
-    volunteers = session.exec(select(Volunteer)).all()
-    return volunteers
+    if after_id is None and limit is None:
+        return stream_rows(_STMT_VOLUNTEERS)
+    
+    rows, next_cursor = fetch_page(session, _STMT_VOLUNTEERS, Volunteer.id, after_id, limit)
+    set_next_cursor_header(response, next_cursor)
+    return rows
+
 
+# Async because the Cloudinary calls are awaited; the DB and Redis work is
+# handed to the threadpool
 @router.post(
     "/logo",
     status_code=status.HTTP_200_OK,
@@ -221,18 +322,20 @@ async def post_shelter_logo(
     file: UploadFile = File(..., description="Logo image file to upload")
 ):
     """Upload the shelter's logo to Cloudinary and save to database. Admin only endpoint."""
-    # Validate file type - only accept images
-    allowed_types = ["image/jpeg", "image/png", "image/gif", "image/webp"]
+    # Validate file type - only accept images whose magic bytes match the
+    # declared type, so mislabeled files never reach Cloudinary
+    head = await file.read(SNIFF_BYTES)
+    await file.seek(0)
     
-    if file.content_type not in allowed_types:
+    declared = LOGO_TYPES.get(file.content_type)
+    if declared is None or sniff_image_type(head) != declared:
         raise HTTPException(
             status_code=400,
             detail="Invalid file type. Allowed: jpg, png, gif, webp"
         )
     
-    # Get existing settings (should be only one record)
-    statement = select(ShelterSettings)
-    existing_settings = session.exec(statement).first()
+    # Get the singleton settings row without blocking the event loop
+    existing_settings = await run_in_threadpool(session.get, ShelterSettings, SHELTER_SETTINGS_ID)
     
     # If there's an old logo, delete it from Cloudinary
     if existing_settings and existing_settings.logo_public_id:
@@ -245,21 +348,7 @@ async def post_shelter_logo(
     # Upload new logo to Cloudinary
     result = await upload_media(file, folder="pawscout/settings", resource_type="image")
     
-    # Update or create settings record
-    if existing_settings:
-        existing_settings.logo_url = result["url"]
-        existing_settings.logo_public_id = result["public_id"]
-        existing_settings.updated_at = datetime.utcnow()
-        session.add(existing_settings)
-    else:
-        new_settings = ShelterSettings(
-            logo_url=result["url"],
-            logo_public_id=result["public_id"]
-        )
-        session.add(new_settings)
-    
-    session.commit()
-    session.refresh(existing_settings if existing_settings else new_settings)
+    await run_in_threadpool(save_logo, session, existing_settings, result["url"], result["public_id"])
     
     return {
         "message": "Shelter logo uploaded and saved successfully",
@@ -274,18 +363,29 @@ async def post_shelter_logo(
     description="Retrieve the current shelter logo URL. Public endpoint.",
     responses={
         200: {"description": "Shelter logo retrieved successfully"},
+        304: {"description": "Logo unchanged since the ETag sent in If-None-Match"},
         404: {"description": "Logo not found"}
     }
 )
-async def get_shelter_logo(session: SessionDep):
+def get_shelter_logo(request: Request, session: SessionDep):
     """Get the current shelter logo URL. Public endpoint."""
-    statement = select(ShelterSettings)
-    settings = session.exec(statement).first()
+    return etag_response(request, load_shelter_logo(session))
+
+
+def load_shelter_logo(session: SessionDep) -> dict:
+    """Return the logo payload from the cache or the database, or raise 404."""
+    cached = cache_get(SHELTER_LOGO_KEY)
+    if cached is not None:
+        return cached
+    
+    settings = session.get(ShelterSettings, SHELTER_SETTINGS_ID)
     
     if not settings or not settings.logo_url:
         raise HTTPException(status_code=404, detail="Shelter logo not found")
     
-    return {"logo_url": settings.logo_url}
+    data = {"logo_url": settings.logo_url}
+    cache_set(SHELTER_LOGO_KEY, data)
+    return data
 
 @router.get(
     "/settings",
@@ -294,13 +394,22 @@ async def get_shelter_logo(session: SessionDep):
     description="Retrieve current shelter settings including logo. Public endpoint.",
     responses={
         200: {"description": "Shelter settings retrieved successfully"},
+        304: {"description": "Settings unchanged since the ETag sent in If-None-Match"},
         404: {"description": "Settings not found"}
     }
 )
-async def get_shelter_settings(session: SessionDep):
+def get_shelter_settings(request: Request, session: SessionDep):
     """Get current shelter settings. Public endpoint."""
-    statement = select(ShelterSettings)
-    settings = session.exec(statement).first()
+    return etag_response(request, load_shelter_settings(session))
+
+
+def load_shelter_settings(session: SessionDep) -> dict:
+    """Return the settings payload from the cache or the database."""
+    cached = cache_get(SHELTER_SETTINGS_KEY)
+    if cached is not None:
+        return cached
+    
+    settings = session.get(ShelterSettings, SHELTER_SETTINGS_ID)
     
     if not settings:
         # Return default settings if none exist
@@ -315,7 +424,9 @@ async def get_shelter_settings(session: SessionDep):
             "zip_code": None
         }
     
-    return settings
+    data = settings.model_dump(mode="json")
+    cache_set(SHELTER_SETTINGS_KEY, data)
+    return data
 
 
 @router.put(
@@ -329,15 +440,41 @@ async def get_shelter_settings(session: SessionDep):
         404: {"description": "Settings not found"}
     }
 )
-async def update_shelter_settings(
+def update_shelter_settings(
     admin: AdminUser,
     session: SessionDep,
     settings_update: ShelterSettingsUpdate
 ):
     """Update shelter settings. Admin only endpoint."""
-    # Get existing settings
-    statement = select(ShelterSettings)
-    existing_settings = session.exec(statement).first()
+    # Update only provided fields
+    update_data = settings_update.model_dump(exclude_unset=True)
+    
+    if update_data:
+        # Apply the update only if some field actually differs; the database
+        # does the comparison, so a real change costs a single statement
+        updated_settings = session.exec(
+            update(ShelterSettings)
+            .where(
+                ShelterSettings.id == SHELTER_SETTINGS_ID,
+                or_(*(
+                    getattr(ShelterSettings, field).is_distinct_from(value)
+                    for field, value in update_data.items()
+                ))
+            )
+            .values(**update_data, updated_at=datetime.utcnow())
+            .returning(ShelterSettings)
+        ).scalars().first()
+        
+        if updated_settings is not None:
+            session.commit()
+            cache_delete(SHELTER_SETTINGS_KEY)
+            return {
+                "message": "La configuración del refugio se ha actualizado exitosamente",
+                "settings": updated_settings
+            }
+    
+    # Nothing was updated: either no settings exist yet or nothing changed
+    existing_settings = session.get(ShelterSettings, SHELTER_SETTINGS_ID)
     
     # If no settings exist, create new record
     if not existing_settings:
@@ -353,41 +490,13 @@ async def update_shelter_settings(
         )
         session.add(new_settings)
         session.commit()
-        session.refresh(new_settings)
+        cache_delete(SHELTER_SETTINGS_KEY)
         return {
             "message": "La configuración del refugio se ha creado exitosamente",
             "settings": new_settings
         }
     
-    # Update only provided fields
-    update_data = settings_update.model_dump(exclude_unset=True)
-    
-    # Check if any field has actually changed
-    has_changes = False
-    for field, value in update_data.items():
-        current_value = getattr(existing_settings, field)
-        if current_value != value:
-            has_changes = True
-            break
-    
-    # If no changes detected, return early
-    if not has_changes:
-        return {
-            "message": "No se detectaron cambios. Los datos son idénticos a los actuales.",
-            "settings": existing_settings
-        }
-    
-    # Apply updates
-    for field, value in update_data.items():
-        setattr(existing_settings, field, value)
-    
-    existing_settings.updated_at = datetime.utcnow()
-    
-    session.add(existing_settings)
-    session.commit()
-    session.refresh(existing_settings)
-    
     return {
-        "message": "La configuración del refugio se ha actualizado exitosamente",
+        "message": "No se detectaron cambios. Los datos son idénticos a los actuales.",
         "settings": existing_settings
     }
\ No newline at end of file
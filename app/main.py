@@ -1,28 +1,42 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from app.routers import animals, volunteer, contact, adopt, users, subs
 from app.cloudinary.routers import media
 from app.internal import admin
 from app.database import create_db_and_tables
-from dotenv import load_dotenv
+from app.dependencies import NEXT_CURSOR_HEADER
+from app.auth import log_password_hasher_backend, shutdown_hash_pool
+from app.cloudinary_config import shutdown_upload_pool
 import os
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    create_db_and_tables()
+    log_password_hasher_backend()
+    yield
+    shutdown_upload_pool()
+    shutdown_hash_pool()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Configure CORS
-origins = [
+dev_origins = {
     "http://localhost:3000",
     "http://127.0.0.1:3000",
     "http://localhost:5173",  # Vite dev server
-]
+}
 
-# Add production frontend URL if available
+# Add production frontend URL if available (.env is loaded by app.database)
 frontend_url = os.getenv("FRONTEND_URL")
-if frontend_url:
-    origins.append(frontend_url)
-    # Also add without trailing slash if it has one
-    if frontend_url.endswith("/"):
-        origins.append(frontend_url.rstrip("/"))
+frontend_origins = {frontend_url, frontend_url.rstrip("/")} if frontend_url else set()
+
+# CORSMiddleware checks every request's Origin with `in`, so use a set
+origins = frozenset(dev_origins | frontend_origins)
 
 app.add_middleware(
     CORSMiddleware,
@@ -30,19 +44,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
-
-@app.on_event("startup")
-def on_startup() -> None:
-    create_db_and_tables()
+# JSON lists repeat the same keys on every row and shrink several-fold;
+# responses under 1 KB aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
-app.include_router(animals.router)
-app.include_router(volunteer.router)
-app.include_router(contact.router)
-app.include_router(adopt.router)
-app.include_router(users.router)
-app.include_router(admin.router)
-app.include_router(media.router)
-app.include_router(subs.router)
\ No newline at end of file
+for router_module in (animals, volunteer, contact, adopt, users, admin, media, subs):
+    app.include_router(router_module.router)
\ No newline at end of file
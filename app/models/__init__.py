@@ -1,3 +1,34 @@
+from app.models.animal import Animal, AnimalBase, AnimalBulkCreate, AnimalListItem, AnimalStatus
+from app.models.adoption import AdoptionApplication, AdoptionApplicationBase, AdoptionStatus, AdoptionSummary
+from app.models.contact import ContactMessage, ContactMessageBase
 from app.models.settings import ShelterSettings
+from app.models.subscription import Subscription, SubscriptionBase, SubscriptionBulkCreate
+from app.models.user import AuthenticatedUser, PawUser, PawUserBase, PawUserPublic
+from app.models.volunteer import Volunteer, VolunteerBase, VolunteerStatus, VolunteerSummary, VolunteerUpdate
 
-__all__ = ["ShelterSettings"]
+__all__ = [
+    "Animal",
+    "AnimalBase",
+    "AnimalBulkCreate",
+    "AnimalListItem",
+    "AnimalStatus",
+    "AdoptionApplication",
+    "AdoptionApplicationBase",
+    "AdoptionStatus",
+    "AdoptionSummary",
+    "ContactMessage",
+    "ContactMessageBase",
+    "ShelterSettings",
+    "Subscription",
+    "SubscriptionBase",
+    "SubscriptionBulkCreate",
+    "AuthenticatedUser",
+    "PawUser",
+    "PawUserBase",
+    "PawUserPublic",
+    "Volunteer",
+    "VolunteerBase",
+    "VolunteerStatus",
+    "VolunteerSummary",
+    "VolunteerUpdate",
+]
@@ -0,0 +1,50 @@
+from pydantic import BaseModel, ConfigDict
+from sqlmodel import SQLModel, Field
+from enum import Enum
+from app.models.types import CachedEmailStr, NonBlankStr
+
+
+class AdoptionStatus(str, Enum):
+    """Status options for animal adoption availability."""
+    approved = "approved"
+    pending = "pending"
+    rejected = "rejected"
+
+
+class AdoptionApplicationBase(SQLModel):
+    """Fields an applicant submits on the adoption form."""
+    animalId: int = Field(foreign_key="animal.id", index=True, description="ID of the animal being adopted")
+    applicantName: NonBlankStr = Field(min_length=1, max_length=100, description="Applicant's first name")
+    applicantLastName: NonBlankStr = Field(min_length=1, max_length=100, description="Applicant's last name")
+    email: CachedEmailStr = Field(description="Applicant's email address")
+    phone: NonBlankStr = Field(min_length=7, max_length=20, description="Applicant's phone number")
+    address: NonBlankStr = Field(min_length=5, max_length=200, description="Street address")
+    city: NonBlankStr = Field(min_length=2, max_length=100, description="City")
+    state: NonBlankStr = Field(min_length=2, max_length=100, description="State or province")
+    zipCode: NonBlankStr = Field(min_length=3, max_length=20, description="Postal/ZIP code")
+    birthdate: NonBlankStr = Field(description="Applicant's birthdate")
+    occupation: NonBlankStr = Field(min_length=2, max_length=100, description="Applicant's occupation")
+    reasonForAdoption: NonBlankStr = Field(min_length=10, max_length=1000, description="Reason for wanting to adopt")
+    experienceWithPets: NonBlankStr = Field(min_length=5, max_length=1000, description="Previous experience with pets")
+    homeType: NonBlankStr = Field(min_length=2, max_length=50, description="Type of home (apartment, house, etc.)")
+    whoLivesInHouse: NonBlankStr = Field(min_length=1, max_length=500, description="Who lives in the household")
+    agreeToTerms: bool = Field(description="Agreement to terms and conditions")
+    date: NonBlankStr = Field(description="Application submission date")
+    status: AdoptionStatus = Field(default=AdoptionStatus.pending, description="Application status (pending, approved, rejected)")
+
+
+class AdoptionApplication(AdoptionApplicationBase, table=True):
+    """Adoption application model for processing animal adoption requests."""
+    id: int | None = Field(default=None, primary_key=True, index=True)
+
+
+class AdoptionSummary(BaseModel):
+    """Short view of an adoption application for admin list screens."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    animalId: int
+    applicantName: str
+    applicantLastName: str
+    date: str
+    status: AdoptionStatus
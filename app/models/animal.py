@@ -0,0 +1,67 @@
+from pydantic import BaseModel, ConfigDict
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, Index, JSON, text
+from typing import List
+from enum import Enum
+from app.models.types import NonBlankStr
+
+# Largest batch accepted by the bulk animal import endpoint
+MAX_BULK_ANIMALS = 500
+
+
+class AnimalStatus(str, Enum):
+    """Status options for animal adoption availability."""
+    available = "available"
+    pending = "pending"
+    adopted = "adopted"
+
+
+class AnimalBase(SQLModel):
+    """Animal fields accepted when creating or replacing a listing."""
+    name: NonBlankStr = Field(index=True, min_length=1, max_length=100, description="Animal's name")
+    type: NonBlankStr = Field(index=True, min_length=1, max_length=50, description="Animal type (e.g., dog, cat)")
+    age: int = Field(ge=0, le=30, description="Animal's age in years")
+    gender: NonBlankStr = Field(min_length=1, max_length=20, description="Animal's gender")
+    size: NonBlankStr = Field(min_length=1, max_length=20, description="Animal's size (small, medium, large)")
+    breed: NonBlankStr = Field(min_length=1, max_length=100, description="Animal's breed")
+    shortDescription: NonBlankStr = Field(min_length=1, max_length=200, description="Brief description")
+    longDescription: NonBlankStr = Field(min_length=1, max_length=2000, description="Detailed description")
+    goodWithKids: bool = Field(description="Whether animal is good with children")
+    goodWithDogs: bool = Field(description="Whether animal is good with other dogs")
+    homeTrained: bool = Field(description="Whether animal is house trained")
+    availableForAdoption: AnimalStatus = Field(default=AnimalStatus.available, description="Adoption availability status")
+    media: List[dict] | None = Field(
+        default=None,
+        sa_column=Column(JSON),
+        description="Array of media objects with url, public_id, and resource_type (image/video)"
+    )
+
+
+class Animal(AnimalBase, table=True):
+    """Animal model for adoption listings."""
+    # Card lists filter by type and/or status and page by id; the partial
+    # index covers the common "only available animals" case at a fraction of
+    # the size.
+    __table_args__ = (
+        Index("ix_animal_type_status_id", "type", "availableForAdoption", "id"),
+        Index("ix_animal_available_id", "id", postgresql_where=text('"availableForAdoption" = \'available\'')),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+
+
+class AnimalBulkCreate(BaseModel):
+    """Many animal listings to store in one insert."""
+    animals: List[AnimalBase] = Field(min_length=1, max_length=MAX_BULK_ANIMALS, description="Animals to create")
+
+
+class AnimalListItem(BaseModel):
+    """Fields shown on animal cards, without the long descriptions."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    type: str
+    age: int
+    availableForAdoption: AnimalStatus
+    media: List[dict] | None = None
@@ -0,0 +1,17 @@
+from sqlmodel import SQLModel, Field
+from app.models.types import CachedEmailStr, NonBlankStr
+
+
+class ContactMessageBase(SQLModel):
+    """Fields submitted through the contact form."""
+    name: NonBlankStr = Field(min_length=1, max_length=100, description="Sender's first name")
+    lastName: NonBlankStr = Field(min_length=1, max_length=100, description="Sender's last name")
+    email: CachedEmailStr = Field(description="Sender's email address")
+    subject: NonBlankStr = Field(min_length=3, max_length=200, description="Message subject")
+    message: NonBlankStr = Field(min_length=10, max_length=2000, description="Message content")
+    date: NonBlankStr = Field(description="Message submission date")
+
+
+class ContactMessage(ContactMessageBase, table=True):
+    """Contact form message model for user inquiries and feedback."""
+    id: int | None = Field(default=None, primary_key=True)
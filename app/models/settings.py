@@ -1,14 +1,21 @@
+from sqlalchemy import CheckConstraint
 from sqlmodel import SQLModel, Field
 from pydantic import BaseModel, EmailStr
 from typing import Optional
 from datetime import datetime
 
+# The shelter has exactly one settings row, always stored under this id
+SHELTER_SETTINGS_ID = 1
+
 
 class ShelterSettings(SQLModel, table=True):
     """Model to store shelter configuration and settings."""
     __tablename__ = "shelter_settings"
+    __table_args__ = (
+        CheckConstraint(f"id = {SHELTER_SETTINGS_ID}", name="shelter_settings_singleton"),
+    )
     
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(default=SHELTER_SETTINGS_ID, primary_key=True)
     logo_url: Optional[str] = Field(default=None, description="URL of the shelter logo on Cloudinary")
     logo_public_id: Optional[str] = Field(default=None, description="Cloudinary public_id for logo management")
     shelter_name: Optional[str] = Field(default="PawScout Shelter", max_length=200)
@@ -0,0 +1,24 @@
+from typing import Annotated
+from pydantic import BaseModel, StringConstraints
+from sqlmodel import SQLModel, Field
+
+# Largest batch accepted by the bulk subscription endpoint
+MAX_BULK_SUBSCRIPTIONS = 1000
+
+# max_length is repeated on the table Field, which is where SQLModel reads the
+# VARCHAR length from; here it bounds each entry of a bulk import
+SubscriberEmail = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=100)]
+
+
+class SubscriptionBase(SQLModel):
+    """Email submitted to the newsletter form."""
+    email: SubscriberEmail = Field(max_length=100, index=True, unique=True, description="Subscriber's email address")
+
+
+class Subscription(SubscriptionBase, table=True):
+    id: int | None = Field(default=None, primary_key=True)
+
+
+class SubscriptionBulkCreate(BaseModel):
+    """Many newsletter emails to store in one insert."""
+    emails: list[SubscriberEmail] = Field(min_length=1, max_length=MAX_BULK_SUBSCRIPTIONS, description="Subscriber email addresses")
@@ -0,0 +1,26 @@
+from functools import lru_cache
+from typing import Annotated
+from pydantic import AfterValidator, StringConstraints, WithJsonSchema
+from pydantic.networks import validate_email
+
+# Whitespace is stripped before length checks, so blank answers are rejected
+# during request validation
+NonBlankStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+# Passwords are never stripped; the pattern only rejects all-whitespace input
+PasswordStr = Annotated[str, StringConstraints(min_length=8, pattern=r"\S")]
+
+
+@lru_cache(maxsize=10_000)
+def _normalize_email(value: str) -> str:
+    # Same check and normalization as EmailStr (no DNS lookups); valid
+    # addresses are remembered, invalid ones raise and are not cached
+    return validate_email(value)[1]
+
+
+# Drop-in for EmailStr that skips the ~50 us parse for addresses seen recently
+CachedEmailStr = Annotated[
+    str,
+    AfterValidator(_normalize_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
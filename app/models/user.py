@@ -0,0 +1,40 @@
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import Index, text
+from sqlmodel import SQLModel, Field
+from app.models.types import CachedEmailStr, NonBlankStr, PasswordStr
+
+
+class PawUserBase(SQLModel):
+    """Fields accepted when registering a user."""
+    email: CachedEmailStr = Field(index=True, unique=True, description="User's email address")
+    name: NonBlankStr = Field(min_length=1, max_length=100, description="User's first name")
+    lastName: NonBlankStr = Field(min_length=1, max_length=100, description="User's last name")
+    password: PasswordStr = Field(description="Hashed password")
+    isAdmin: bool = Field(default=False, description="Whether user has admin privileges")
+
+
+class PawUser(PawUserBase, table=True):
+    """User model for authentication and authorization."""
+    # Admins are a handful of rows, so a partial index keeps admin lookups
+    # cheap without indexing every regular user.
+    __table_args__ = (
+        Index("ix_pawuser_admin", "id", postgresql_where=text('"isAdmin" IS TRUE')),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+
+
+class PawUserPublic(BaseModel):
+    """Public view of a user, without the password hash."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    email: str
+    name: str
+    lastName: str
+    isAdmin: bool
+
+
+class AuthenticatedUser(PawUserPublic):
+    """Immutable snapshot of the signed-in user, safe to share between requests."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
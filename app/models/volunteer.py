@@ -0,0 +1,67 @@
+from typing import List
+from pydantic import BaseModel, ConfigDict
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, String
+from sqlalchemy.dialects.postgresql import ARRAY
+from enum import Enum
+from app.models.types import CachedEmailStr, NonBlankStr
+
+
+class VolunteerStatus(str, Enum):
+    """Status options for volunteer applications."""
+    pending = "pending"
+    accepted = "accepted"
+    rejected = "rejected"
+
+
+class VolunteerBase(SQLModel):
+    """Fields submitted on the volunteer form."""
+    name: NonBlankStr = Field(min_length=1, max_length=100, description="Volunteer's first name")
+    lastName: NonBlankStr = Field(min_length=1, max_length=100, description="Volunteer's last name")
+    email: CachedEmailStr = Field(index=True, unique=True, description="Volunteer's email address")
+    phone: NonBlankStr = Field(min_length=7, max_length=20, index=True, unique=True, description="Volunteer's phone number")
+    availability: List[str] = Field(min_length=1, sa_column=Column(ARRAY(String)), description="Time availability (e.g., weekdays, weekends)")
+    availableDays: List[str] = Field(min_length=1, sa_column=Column(ARRAY(String)), description="Specific days available")
+    areasOfInterest: List[str] = Field(min_length=1, sa_column=Column(ARRAY(String)), description="Areas of interest for volunteering")
+    whyVolunteer: NonBlankStr = Field(min_length=10, max_length=1000, description="Reason for wanting to volunteer")
+    specialSkills: NonBlankStr = Field(min_length=1, max_length=500, description="Special skills or qualifications")
+    emergencyContactName: NonBlankStr = Field(min_length=1, max_length=100, description="Emergency contact name")
+    emergencyContactPhone: NonBlankStr = Field(min_length=7, max_length=20, description="Emergency contact phone number")
+    status: VolunteerStatus = Field(default=VolunteerStatus.pending, description="Application status")
+    privacyAgreement: bool = Field(default=False, description="Agreement to privacy policy")
+    date: NonBlankStr = Field(description="Application submission date")
+
+
+class VolunteerUpdate(SQLModel):
+    """Volunteer fields an admin may change; omitted fields keep their value."""
+    name: NonBlankStr | None = Field(default=None, min_length=1, max_length=100)
+    lastName: NonBlankStr | None = Field(default=None, min_length=1, max_length=100)
+    email: CachedEmailStr | None = None
+    phone: NonBlankStr | None = Field(default=None, min_length=7, max_length=20)
+    availability: List[str] | None = Field(default=None, min_length=1)
+    availableDays: List[str] | None = Field(default=None, min_length=1)
+    areasOfInterest: List[str] | None = Field(default=None, min_length=1)
+    whyVolunteer: NonBlankStr | None = Field(default=None, min_length=10, max_length=1000)
+    specialSkills: NonBlankStr | None = Field(default=None, min_length=1, max_length=500)
+    emergencyContactName: NonBlankStr | None = Field(default=None, min_length=1, max_length=100)
+    emergencyContactPhone: NonBlankStr | None = Field(default=None, min_length=7, max_length=20)
+    status: VolunteerStatus | None = None
+    privacyAgreement: bool | None = None
+    date: NonBlankStr | None = None
+
+
+class Volunteer(VolunteerBase, table=True):
+    """Volunteer application model for managing volunteer registrations."""
+    id: int | None = Field(default=None, primary_key=True, index=True, unique=True)
+
+
+class VolunteerSummary(BaseModel):
+    """Short view of a volunteer application for admin list screens."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    lastName: str
+    email: str
+    status: VolunteerStatus
+    date: str
@@ -0,0 +1,98 @@
+import hashlib
+from typing import Any, Iterator
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
+from app.database import engine
+
+# Rows fetched per round-trip from the server-side cursor
+STREAM_BATCH_SIZE = 500
+
+
+def _iter_encoded_batches(statement) -> Iterator[list[bytes]]:
+    # The request's session is closed before the body is sent, so the
+    # stream opens its own and keeps it for as long as rows are flowing.
+    # Each batch becomes one body chunk, so the threadpool hop that
+    # StreamingResponse makes per chunk is paid per batch, not per row.
+    with Session(engine) as session:
+        result = session.exec(statement.execution_options(yield_per=STREAM_BATCH_SIZE))
+        for batch in result.partitions():
+            # The model's compiled pydantic-core serializer writes JSON bytes
+            # directly, without building an intermediate dict per row
+            serializer = batch[0].__pydantic_serializer__
+            yield [serializer.to_json(row) for row in batch]
+
+
+def _iter_json_rows(statement, key: str | None) -> Iterator[bytes]:
+    yield b'{"%s":[' % key.encode() if key else b"["
+    separator = b""
+    for batch in _iter_encoded_batches(statement):
+        yield separator + b",".join(batch)
+        separator = b","
+    yield b"]}" if key else b"]"
+
+
+def _iter_ndjson_rows(statement) -> Iterator[bytes]:
+    for batch in _iter_encoded_batches(statement):
+        yield b"\n".join(batch) + b"\n"
+
+
+def stream_rows(statement, key: str | None = None) -> StreamingResponse:
+    """
+    Stream the results of a select statement as a JSON array.
+
+    Rows are read through a server-side cursor and encoded one at a time, so
+    memory stays bounded by the batch size instead of the table size.
+
+    Args:
+        statement: SQLModel select returning table models
+        key: Wrap the array in an object under this key, e.g. {"requests": [...]}
+
+    Returns:
+        StreamingResponse with an application/json body
+    """
+    return StreamingResponse(_iter_json_rows(statement, key), media_type="application/json")
+
+
+def stream_ndjson(statement) -> StreamingResponse:
+    """
+    Stream the results of a select statement as newline-delimited JSON.
+
+    Same server-side cursor as stream_rows, but each row is a complete JSON
+    document on its own line, so clients can start processing before the
+    body ends.
+
+    Args:
+        statement: SQLModel select returning table models
+
+    Returns:
+        StreamingResponse with an application/x-ndjson body
+    """
+    return StreamingResponse(_iter_ndjson_rows(statement), media_type="application/x-ndjson")
+
+
+def etag_response(request: Request, data: Any, cache_control: str = "no-cache") -> Response:
+    """
+    Return data as JSON with an ETag, or an empty 304 if the client has it.
+
+    The tag is a hash of the encoded body, so it changes exactly when the
+    response does and needs no timestamp column to derive it from.
+
+    Args:
+        request: Incoming request, checked for If-None-Match
+        data: JSON-serializable response content
+        cache_control: Cache-Control header value; the default makes clients
+            revalidate every time, which costs only a 304 when nothing changed
+
+    Returns:
+        Response with the JSON body, or a bodyless 304
+    """
+    body = orjson.dumps(data)
+    etag = '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,12 +1,14 @@
-from fastapi import APIRouter, HTTPException, status, Body
-from pydantic import EmailStr
-from sqlmodel import SQLModel, Field, select
-from app.database import SessionDep
-from app.dependencies import AdminUser
-from app.routers.animals import Animal, AnimalStatus
-from enum import Enum
-
-
+from fastapi import APIRouter, HTTPException, Request, Response, status, Body
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.orm import raiseload
+from sqlmodel import select, update, delete
+from app.database import SessionDep, fetch_page
+from app.dependencies import AdminUser, AfterId, ListFormat, PageLimit, set_next_cursor_header, get_or_404
+from app.responses import etag_response, stream_ndjson
+from app.models.animal import Animal, AnimalStatus
+from app.models.adoption import AdoptionApplication, AdoptionApplicationBase, AdoptionStatus
+from app.cache import cache_get, cache_set, cache_delete, animal_key, ADOPTIONS_LIST_KEY, ANIMALS_LIST_KEY, LIST_TTL
 
 
 router = APIRouter(
@@ -14,36 +16,17 @@ router = APIRouter(
     tags=["adopt"],
 )
 
-class AdoptionStatus(str, Enum):
-    """Status options for animal adoption availability."""
-    approved = "approved"
-    pending = "pending"
-    rejected = "rejected"
-
-
-class AdoptionApplication(SQLModel, table=True):
-    """Adoption application model for processing animal adoption requests."""
-    id: int | None = Field(default=None, primary_key=True, index=True)
-    animalId: int = Field(foreign_key="animal.id", index=True, description="ID of the animal being adopted")
-    applicantName: str = Field(min_length=1, max_length=100, description="Applicant's first name")
-    applicantLastName: str = Field(min_length=1, max_length=100, description="Applicant's last name")
-    email: EmailStr = Field(description="Applicant's email address")
-    phone: str = Field(min_length=7, max_length=20, description="Applicant's phone number")
-    address: str = Field(min_length=5, max_length=200, description="Street address")
-    city: str = Field(min_length=2, max_length=100, description="City")
-    state: str = Field(min_length=2, max_length=100, description="State or province")
-    zipCode: str = Field(min_length=3, max_length=20, description="Postal/ZIP code")
-    birthdate: str = Field(description="Applicant's birthdate")
-    occupation: str = Field(min_length=2, max_length=100, description="Applicant's occupation")
-    reasonForAdoption: str = Field(min_length=10, max_length=1000, description="Reason for wanting to adopt")
-    experienceWithPets: str = Field(min_length=5, max_length=1000, description="Previous experience with pets")
-    homeType: str = Field(min_length=2, max_length=50, description="Type of home (apartment, house, etc.)")
-    whoLivesInHouse: str = Field(min_length=1, max_length=500, description="Who lives in the household")
-    agreeToTerms: bool = Field(description="Agreement to terms and conditions")
-    date: str = Field(description="Application submission date")
-    status: AdoptionStatus = Field(default=AdoptionStatus.pending, description="Application status (pending, approved, rejected)")
-
- 
+_STMT_APPLICATIONS = select(AdoptionApplication).options(raiseload("*"))
+_APPLICATION_LIST = TypeAdapter(list[AdoptionApplication])
+
+# Animal status that follows from each application decision
+_ANIMAL_STATUS_FOR = {
+    AdoptionStatus.approved: AnimalStatus.adopted,
+    AdoptionStatus.pending: AnimalStatus.pending,
+    AdoptionStatus.rejected: AnimalStatus.available,
+}
+
+
 @router.post(
     "/{animal_id}",
     status_code=status.HTTP_201_CREATED,
@@ -51,38 +34,34 @@ class AdoptionApplication(SQLModel, table=True):
     description="Submit an adoption application for a specific animal. The animal's status will be updated to 'pending'. All fields must be provided and validated.",
     responses={
         201: {"description": "Adoption application submitted successfully"},
-        400: {"description": "Invalid input - empty fields or validation errors"},
+        422: {"description": "Invalid input - empty fields or validation errors"},
         404: {"description": "Animal not found"},
         409: {"description": "Animal already in adoption process (pending or approved)"}
     }
 )
-async def submit_adoption_application(
-    animal_id: int, application: AdoptionApplication, session: SessionDep
+def submit_adoption_application(
+    animal_id: int, application: AdoptionApplicationBase, session: SessionDep
 ):
 
-    #verify if animal exists with the given animal_id
-    animal = session.get(Animal, animal_id)
-    if not animal:
-        raise HTTPException(status_code=404, detail="Animal not found")
-
-    if animal.availableForAdoption in [AnimalStatus.pending, AnimalStatus.adopted]:
+    # Reserve the animal in one conditional UPDATE so two applicants can't both claim it
+    reserved = session.exec(
+        update(Animal)
+        .where(
+            Animal.id == animal_id,
+            Animal.availableForAdoption.notin_((AnimalStatus.pending, AnimalStatus.adopted))
+        )
+        .values(availableForAdoption=AnimalStatus.pending)
+        .returning(Animal.id)
+    ).first()
+    if reserved is None:
+        # Nothing was updated; probe only on this path to tell 404 from 409
+        if session.exec(select(Animal.id).where(Animal.id == animal_id)).first() is None:
+            raise HTTPException(status_code=404, detail="Animal not found")
         raise HTTPException(status_code=409, detail="Animal is already in adoption process")
 
-    for field, value in application.dict().items():
-        if field in ["id", "animalId", "status"]:
-            continue
-
-        if isinstance(value, str) and value.strip() == "":
-                raise HTTPException(status_code=400, detail=f"{field} cannot be empty")
-
-    # Set animal status to pending
-    animal.availableForAdoption = AdoptionStatus.pending
-    session.add(animal)
-
-    application.status = AdoptionStatus.pending
-    session.add(application)
+    session.add(AdoptionApplication.model_validate(application, update={"status": AdoptionStatus.pending}))
     session.commit()
-    session.refresh(application)
+    cache_delete(ADOPTIONS_LIST_KEY, ANIMALS_LIST_KEY, animal_key(animal_id))
     return {"success": "Adoption application submitted successfully"}
 
 
@@ -93,16 +72,16 @@ async def submit_adoption_application(
     description="Retrieve details of a specific adoption application. Requires admin privileges.",
     responses={
         200: {"description": "Application found"},
+        304: {"description": "Application unchanged since the ETag sent in If-None-Match"},
         401: {"description": "Unauthorized - Invalid or missing token"},
         403: {"description": "Forbidden - Admin privileges required"},
         404: {"description": "Application not found"}
     }
 )
-async def get_adoption_application(application_id: int, session: SessionDep, admin: AdminUser):
-    application = session.get(AdoptionApplication, application_id)
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
-    return application
+def get_adoption_application(application_id: int, request: Request, session: SessionDep, admin: AdminUser):
+    application = get_or_404(session, AdoptionApplication, application_id, "Application not found")
+    # Admin-only data: browsers may revalidate it, shared caches must not keep it
+    return etag_response(request, application.model_dump(mode="json"), cache_control="private, no-cache")
 
 @router.get(
     "/",
@@ -115,9 +94,33 @@ async def get_adoption_application(application_id: int, session: SessionDep, adm
         403: {"description": "Forbidden - Admin privileges required"}
     }
 )
-async def get_adoption_applications(session: SessionDep, admin: AdminUser):
-    applications = session.exec(select(AdoptionApplication)).all()
-    return {"applications": applications}
+def get_adoption_applications(
+    session: SessionDep,
+    admin: AdminUser,
+    response: Response,
+    after_id: AfterId = None,
+    limit: PageLimit = None,
+    response_format: ListFormat = "json",
+):
+    if response_format == "ndjson":
+        return stream_ndjson(_STMT_APPLICATIONS)
+
+    if after_id is not None or limit is not None:
+        applications, next_cursor = fetch_page(
+            session, _STMT_APPLICATIONS, AdoptionApplication.id, after_id, limit
+        )
+        set_next_cursor_header(response, next_cursor)
+        return {"applications": applications, "next_cursor": next_cursor}
+
+    # Already JSON-ready, so skip FastAPI's jsonable_encoder pass
+    cached = cache_get(ADOPTIONS_LIST_KEY)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    applications = session.exec(_STMT_APPLICATIONS).all()
+    data = {"applications": _APPLICATION_LIST.dump_python(applications, mode="json")}
+    cache_set(ADOPTIONS_LIST_KEY, data, ttl=LIST_TTL)
+    return ORJSONResponse(data)
 
 @router.delete(
     "/{application_id}",
@@ -131,20 +134,25 @@ async def get_adoption_applications(session: SessionDep, admin: AdminUser):
         404: {"description": "Application not found"}
     }
 )
-async def delete_adoption_application(application_id: int, session: SessionDep, admin: AdminUser):
-    application = session.get(AdoptionApplication, application_id)
-    if not application:
+def delete_adoption_application(application_id: int, session: SessionDep, admin: AdminUser):
+    deleted = session.exec(
+        delete(AdoptionApplication)
+        .where(AdoptionApplication.id == application_id)
+        .returning(AdoptionApplication.animalId, AdoptionApplication.status)
+    ).first()
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Application not found")
 
     # Check if the application was rejected or pending before deleting, if so set the animal's status back to available
-    if application.status in [AdoptionStatus.rejected, AdoptionStatus.pending]:
-        animal = session.get(Animal, application.animalId)
-        if animal:
-            animal.availableForAdoption = AnimalStatus.available
-            session.add(animal)
+    if deleted.status in (AdoptionStatus.rejected, AdoptionStatus.pending):
+        session.exec(
+            update(Animal)
+            .where(Animal.id == deleted.animalId)
+            .values(availableForAdoption=AnimalStatus.available)
+        )
 
-    session.delete(application)
     session.commit()
+    cache_delete(ADOPTIONS_LIST_KEY, ANIMALS_LIST_KEY, animal_key(deleted.animalId))
     return {"success": "Adoption application deleted successfully"}
 
 @router.put(
@@ -160,32 +168,32 @@ async def delete_adoption_application(application_id: int, session: SessionDep,
         404: {"description": "Application not found"}
     }
 )
-async def update_adoption_application_status(
+def update_adoption_application_status(
     application_id: int,
     new_status: AdoptionStatus = Body(..., embed=True, alias="status"),
     session: SessionDep = None,
     admin: AdminUser = None,
 ):
-    application = session.get(AdoptionApplication, application_id)
-    if not application:
+    animal_id = session.exec(
+        update(AdoptionApplication)
+        .where(AdoptionApplication.id == application_id)
+        .values(status=new_status)
+        .returning(AdoptionApplication.animalId)
+    ).scalar_one_or_none()
+    if animal_id is None:
         raise HTTPException(status_code=404, detail="Application not found")
 
-    animal = session.get(Animal, application.animalId)
-    if not animal:
+    updated_animal_id = session.exec(
+        update(Animal)
+        .where(Animal.id == animal_id)
+        .values(availableForAdoption=_ANIMAL_STATUS_FOR[new_status])
+        .returning(Animal.id)
+    ).scalar_one_or_none()
+    if updated_animal_id is None:
+        session.rollback()
         raise HTTPException(status_code=404, detail="Associated animal not found")
 
-    application.status = new_status
-
-    if new_status == AdoptionStatus.approved:
-        animal.availableForAdoption = AnimalStatus.adopted
-    elif new_status == AdoptionStatus.pending:
-        animal.availableForAdoption = AnimalStatus.pending
-    elif new_status == AdoptionStatus.rejected:
-        animal.availableForAdoption = AnimalStatus.available
-
-    session.add(application)
-    session.add(animal)
     session.commit()
-    session.refresh(application)
+    cache_delete(ADOPTIONS_LIST_KEY, ANIMALS_LIST_KEY, animal_key(animal_id))
 
     return {"success": "Adoption application status updated successfully"}
\ No newline at end of file
@@ -1,45 +1,31 @@
-from fastapi import APIRouter, HTTPException, status
-from sqlmodel import SQLModel, Field, select
-from sqlalchemy import Column, String, JSON
-from sqlalchemy.dialects.postgresql import ARRAY
-from typing import List
-from enum import Enum
-from app.database import SessionDep
-from app.dependencies import AdminUser
-
-
-class AnimalStatus(str, Enum):
-    """Status options for animal adoption availability."""
-    available = "available"
-    pending = "pending"
-    adopted = "adopted"
-
-class Animal(SQLModel, table=True):
-    """Animal model for adoption listings."""
-    id: int | None = Field(default=None, primary_key=True)
-    name: str = Field(index=True, min_length=1, max_length=100, description="Animal's name")
-    type: str = Field(index=True, min_length=1, max_length=50, description="Animal type (e.g., dog, cat)")
-    age: int = Field(ge=0, le=30, description="Animal's age in years")
-    gender: str = Field(min_length=1, max_length=20, description="Animal's gender")
-    size: str = Field(min_length=1, max_length=20, description="Animal's size (small, medium, large)")
-    breed: str = Field(min_length=1, max_length=100, description="Animal's breed")
-    shortDescription: str = Field(min_length=1, max_length=200, description="Brief description")
-    longDescription: str = Field(min_length=1, max_length=2000, description="Detailed description")
-    goodWithKids: bool = Field(description="Whether animal is good with children")
-    goodWithDogs: bool = Field(description="Whether animal is good with other dogs")
-    homeTrained: bool = Field(description="Whether animal is house trained")
-    availableForAdoption: AnimalStatus = Field(default=AnimalStatus.available, description="Adoption availability status")
-    media: List[dict] | None = Field(
-        default=None,
-        sa_column=Column(JSON),
-        description="Array of media objects with url, public_id, and resource_type (image/video)"
-    )
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy.orm import raiseload
+from sqlmodel import select, insert, update, delete
+from app.database import SessionDep, fetch_page
+from app.dependencies import AdminUser, AfterId, ListFormat, PageLimit, set_next_cursor_header, get_or_404
+from app.responses import etag_response, stream_ndjson
+from app.models.animal import Animal, AnimalBase, AnimalBulkCreate, AnimalListItem, AnimalStatus
+from app.cache import cache_get, cache_set, cache_delete, animal_key, ANIMALS_LIST_KEY, LIST_TTL, ITEM_TTL
+
 
 router = APIRouter(
     prefix="/animals",
     tags=["animals"],
 )
 
+# Lists load plain rows; raiseload makes any future relationship access on
+# them fail loudly instead of issuing one lazy SELECT per row
+_STMT_ANIMALS = select(Animal).options(raiseload("*"))
+
+# Serializes a whole result list in one pydantic-core call instead of a
+# Python-level model_dump() per row
+_ANIMAL_LIST = TypeAdapter(list[Animal])
+
+_STMT_ANIMAL_LIST_ITEMS = select(
+    Animal.id, Animal.name, Animal.type, Animal.age, Animal.availableForAdoption, Animal.media
+)
+
 
 @router.get(
     "/",
@@ -47,12 +33,67 @@ router = APIRouter(
     summary="Get all animals",
     description="Retrieve a list of all animals available for adoption, including those pending or already adopted.",
     responses={
-        200: {"description": "List of all animals"}
+        200: {"description": "List of all animals"},
+        304: {"description": "List unchanged since the ETag sent in If-None-Match"}
+    }
+)
+def read_animals(
+    request: Request,
+    session: SessionDep,
+    response: Response,
+    after_id: AfterId = None,
+    limit: PageLimit = None,
+    response_format: ListFormat = "json",
+):
+    if response_format == "ndjson":
+        return stream_ndjson(_STMT_ANIMALS)
+
+    if after_id is not None or limit is not None:
+        animals, next_cursor = fetch_page(session, _STMT_ANIMALS, Animal.id, after_id, limit)
+        set_next_cursor_header(response, next_cursor)
+        return {"animals": animals, "next_cursor": next_cursor}
+
+    # The payload is already JSON-ready, so it is encoded once for the ETag
+    # and sent as is, instead of FastAPI walking every row again
+    data = cache_get(ANIMALS_LIST_KEY)
+    if data is None:
+        animals = session.exec(_STMT_ANIMALS).all()
+        data = {"animals": _ANIMAL_LIST.dump_python(animals, mode="json")}
+        cache_set(ANIMALS_LIST_KEY, data, ttl=LIST_TTL)
+    return etag_response(request, data)
+
+
+@router.get(
+    "/summary",
+    status_code=status.HTTP_200_OK,
+    response_model=list[AnimalListItem],
+    response_model_exclude_none=True,
+    summary="Get animal cards",
+    description="Retrieve only the fields needed to render animal cards in list views, optionally filtered by type and adoption status. Use /animals/{animal_id} for full details.",
+    responses={
+        200: {"description": "List of animal cards"}
     }
 )
-async def read_animals(session: SessionDep):
-    animals = session.exec(select(Animal)).all()
-    return {"animals": animals}
+def read_animal_summaries(
+    session: SessionDep,
+    response: Response,
+    type: str | None = None,
+    availableForAdoption: AnimalStatus | None = None,
+    after_id: AfterId = None,
+    limit: PageLimit = None,
+):
+    statement = _STMT_ANIMAL_LIST_ITEMS
+    if type is not None:
+        statement = statement.where(Animal.type == type)
+    if availableForAdoption is not None:
+        statement = statement.where(Animal.availableForAdoption == availableForAdoption)
+
+    if after_id is None and limit is None:
+        return session.exec(statement).all()
+
+    rows, next_cursor = fetch_page(session, statement, Animal.id, after_id, limit)
+    set_next_cursor_header(response, next_cursor)
+    return rows
 
 
 @router.get(
@@ -62,14 +103,17 @@ async def read_animals(session: SessionDep):
     description="Retrieve detailed information about a specific animal by its ID.",
     responses={
         200: {"description": "Animal found"},
+        304: {"description": "Animal unchanged since the ETag sent in If-None-Match"},
         404: {"description": "Animal not found"}
     }
 )
-async def read_animal(animal_id: int, session: SessionDep):
-    animal = session.get(Animal, animal_id)
-    if not animal:
-        raise HTTPException(status_code=404, detail="Animal not found")
-    return animal
+def read_animal(animal_id: int, request: Request, session: SessionDep):
+    data = cache_get(animal_key(animal_id))
+    if data is None:
+        animal = get_or_404(session, Animal, animal_id, "Animal not found")
+        data = animal.model_dump(mode="json")
+        cache_set(animal_key(animal_id), data, ttl=ITEM_TTL)
+    return etag_response(request, data)
 
 
 @router.post(
@@ -79,28 +123,36 @@ async def read_animal(animal_id: int, session: SessionDep):
     description="Add a new animal to the adoption system. All fields except 'id' and 'availableForAdoption' are required. Requires admin privileges.",
     responses={
         201: {"description": "Animal created successfully"},
-        400: {"description": "Invalid input - empty fields or validation errors"},
+        422: {"description": "Invalid input - empty fields or validation errors"},
         401: {"description": "Unauthorized - Invalid or missing token"},
         403: {"description": "Forbidden - Admin privileges required"}
     }
 )
-async def create_animal(animal: Animal, session: SessionDep, admin: AdminUser): 
-
-    for field, value in animal.dict().items():
-        if field == "id": 
-            continue
-
-        if field == "availableForAdoption":
-            continue
+def create_animal(animal: AnimalBase, session: SessionDep, admin: AdminUser):
+    session.add(Animal.model_validate(animal))
+    session.commit()
+    cache_delete(ANIMALS_LIST_KEY)
 
-        if isinstance(value, str) and value.strip() == "":
-                raise HTTPException(status_code=400, detail=f"{field} cannot be empty")
+    return {"success": "Animal created successfully"}
 
-    session.add(animal) 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    summary="Import many animal listings",
+    description="Create up to 500 animals with a single multi-row INSERT and one commit, e.g. when onboarding a shelter. The batch is all-or-nothing. Requires admin privileges.",
+    responses={
+        201: {"description": "Animals created successfully"},
+        422: {"description": "Invalid input - empty fields or validation errors"},
+        401: {"description": "Unauthorized - Invalid or missing token"},
+        403: {"description": "Forbidden - Admin privileges required"}
+    }
+)
+def create_animals_bulk(bulk: AnimalBulkCreate, session: SessionDep, admin: AdminUser):
+    session.exec(insert(Animal).values([animal.model_dump() for animal in bulk.animals]))
     session.commit()
-    session.refresh(animal)
+    cache_delete(ANIMALS_LIST_KEY)
 
-    return {"success": "Animal created successfully"}
+    return {"success": "Animals created successfully", "count": len(bulk.animals)}
 
 @router.put(
     "/{animal_id}",
@@ -109,29 +161,25 @@ async def create_animal(animal: Animal, session: SessionDep, admin: AdminUser):
     description="Update all information for an existing animal. Requires all fields to be provided. Requires admin privileges.",
     responses={
         200: {"description": "Animal updated successfully"},
-        400: {"description": "Invalid input - empty fields or validation errors"},
+        422: {"description": "Invalid input - empty fields or validation errors"},
         401: {"description": "Unauthorized - Invalid or missing token"},
         403: {"description": "Forbidden - Admin privileges required"},
         404: {"description": "Animal not found"}
     }
 )
-async def update_animal(animal_id: int, updated_animal: Animal, session: SessionDep, admin: AdminUser):
-    animal = session.get(Animal, animal_id)
-    if not animal:
+def update_animal(animal_id: int, updated_animal: AnimalBase, session: SessionDep, admin: AdminUser):
+    # Replace the row in place; the primary key always comes from the path
+    updated_id = session.exec(
+        update(Animal)
+        .where(Animal.id == animal_id)
+        .values(updated_animal.model_dump())
+        .returning(Animal.id)
+    ).scalar_one_or_none()
+    if updated_id is None:
         raise HTTPException(status_code=404, detail="Animal not found")
 
-    for field, value in updated_animal.dict().items():
-        if field == "id":
-            continue
-
-        if isinstance(value, str) and value.strip() == "":
-                raise HTTPException(status_code=400, detail=f"{field} cannot be empty")
-
-        setattr(animal, field, value)
-
-    session.add(animal)
     session.commit()
-    session.refresh(animal)
+    cache_delete(ANIMALS_LIST_KEY, animal_key(animal_id))
 
     return {"success": "Animal updated successfully"}
 
@@ -147,12 +195,14 @@ async def update_animal(animal_id: int, updated_animal: Animal, session: Session
         404: {"description": "Animal not found"}
     }
 )
-async def delete_animal(animal_id: int, session: SessionDep, admin: AdminUser):
-    animal = session.get(Animal, animal_id)
-    if not animal:
+def delete_animal(animal_id: int, session: SessionDep, admin: AdminUser):
+    deleted_id = session.exec(
+        delete(Animal).where(Animal.id == animal_id).returning(Animal.id)
+    ).scalar_one_or_none()
+    if deleted_id is None:
         raise HTTPException(status_code=404, detail="Animal not found")
 
-    session.delete(animal)
     session.commit()
+    cache_delete(ANIMALS_LIST_KEY, animal_key(animal_id))
 
     return {"success": "Animal deleted successfully"}
\ No newline at end of file
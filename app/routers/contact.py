@@ -1,24 +1,21 @@
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, EmailStr
-from sqlmodel import SQLModel, Field, select
-from app.database import SessionDep
-from app.dependencies import AdminUser
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.orm import raiseload
+from sqlmodel import select, delete
+from app.database import SessionDep, fetch_page
+from app.dependencies import AdminUser, AfterId, ListFormat, PageLimit, set_next_cursor_header, get_or_404
+from app.responses import etag_response, stream_ndjson
+from app.models.contact import ContactMessage, ContactMessageBase
+from app.cache import cache_get, cache_set, cache_delete, CONTACT_LIST_KEY, LIST_TTL
  
 router = APIRouter(
     prefix="/contact",
     tags=["contact"],
 )
 
-class ContactMessage(SQLModel, table=True):
-    """Contact form message model for user inquiries and feedback."""
-    id: int | None = Field(default=None, primary_key=True)
-    name: str = Field(min_length=1, max_length=100, description="Sender's first name")
-    lastName: str = Field(min_length=1, max_length=100, description="Sender's last name")
-    email: EmailStr = Field(description="Sender's email address")
-    subject: str = Field(min_length=3, max_length=200, description="Message subject")
-    message: str = Field(min_length=10, max_length=2000, description="Message content")
-    date: str = Field(description="Message submission date")
-
+_STMT_CONTACT_MESSAGES = select(ContactMessage).options(raiseload("*"))
+_CONTACT_MESSAGE_LIST = TypeAdapter(list[ContactMessage])
 
 
 @router.post(
@@ -28,20 +25,13 @@ class ContactMessage(SQLModel, table=True):
     description="Submit a contact form message. All fields are required and will be validated.",
     responses={
         201: {"description": "Contact message sent successfully"},
-        400: {"description": "Invalid input - empty fields or validation errors"}
+        422: {"description": "Invalid input - empty fields or validation errors"}
     }
 )
-async def send_contact_message(contact_message: ContactMessage, session: SessionDep):
-    for field, value in contact_message.dict().items():
-        if field == "id":
-            continue
-
-        if isinstance(value, str) and value.strip() == "":
-                raise HTTPException(status_code=400, detail=f"{field} cannot be empty")
-
-    session.add(contact_message)
+def send_contact_message(contact_message: ContactMessageBase, session: SessionDep):
+    session.add(ContactMessage.model_validate(contact_message))
     session.commit()
-    session.refresh(contact_message)
+    cache_delete(CONTACT_LIST_KEY)
     return {"success": "Contact message sent successfully"}
 
 @router.get(
@@ -51,16 +41,15 @@ async def send_contact_message(contact_message: ContactMessage, session: Session
     description="Retrieve a specific contact message by its ID. Requires admin privileges.",
     responses={
         200: {"description": "Contact message found"},
+        304: {"description": "Message unchanged since the ETag sent in If-None-Match"},
         401: {"description": "Unauthorized - Invalid or missing token"},
         403: {"description": "Forbidden - Admin privileges required"},
         404: {"description": "Contact message not found"}
     }
 )
-async def get_contact_message(message_id: int, session: SessionDep, admin: AdminUser):
-    contact_message = session.get(ContactMessage, message_id)
-    if not contact_message:
-        raise HTTPException(status_code=404, detail="Contact message not found")
-    return contact_message
+def get_contact_message(message_id: int, request: Request, session: SessionDep, admin: AdminUser):
+    contact_message = get_or_404(session, ContactMessage, message_id, "Contact message not found")
+    return etag_response(request, contact_message.model_dump(mode="json"), cache_control="private, no-cache")
 
 @router.get(
     "/",
@@ -73,9 +62,31 @@ async def get_contact_message(message_id: int, session: SessionDep, admin: Admin
         403: {"description": "Forbidden - Admin privileges required"}
     }
 )
-async def get_all_contact_messages(session: SessionDep, admin: AdminUser):
-    messages = session.exec(select(ContactMessage)).all()
-    return {"contact_messages": messages}
+def get_all_contact_messages(
+    session: SessionDep,
+    admin: AdminUser,
+    response: Response,
+    after_id: AfterId = None,
+    limit: PageLimit = None,
+    response_format: ListFormat = "json",
+):
+    if response_format == "ndjson":
+        return stream_ndjson(_STMT_CONTACT_MESSAGES)
+
+    if after_id is not None or limit is not None:
+        messages, next_cursor = fetch_page(session, _STMT_CONTACT_MESSAGES, ContactMessage.id, after_id, limit)
+        set_next_cursor_header(response, next_cursor)
+        return {"contact_messages": messages, "next_cursor": next_cursor}
+
+    # Already JSON-ready, so skip FastAPI's jsonable_encoder pass
+    cached = cache_get(CONTACT_LIST_KEY)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    messages = session.exec(_STMT_CONTACT_MESSAGES).all()
+    data = {"contact_messages": _CONTACT_MESSAGE_LIST.dump_python(messages, mode="json")}
+    cache_set(CONTACT_LIST_KEY, data, ttl=LIST_TTL)
+    return ORJSONResponse(data)
 
 @router.delete(
     "/{message_id}",
@@ -89,10 +100,12 @@ async def get_all_contact_messages(session: SessionDep, admin: AdminUser):
         404: {"description": "Contact message not found"}
     }
 )
-async def delete_contact_message(message_id: int, session: SessionDep, admin: AdminUser):
-    contact_message = session.get(ContactMessage, message_id)
-    if not contact_message:
+def delete_contact_message(message_id: int, session: SessionDep, admin: AdminUser):
+    deleted_id = session.exec(
+        delete(ContactMessage).where(ContactMessage.id == message_id).returning(ContactMessage.id)
+    ).scalar_one_or_none()
+    if deleted_id is None:
         raise HTTPException(status_code=404, detail="Contact message not found")
-    session.delete(contact_message)
     session.commit()
+    cache_delete(CONTACT_LIST_KEY)
     return {"success": "Contact message deleted successfully"}
\ No newline at end of file
@@ -1,6 +1,10 @@
-from fastapi import APIRouter, HTTPException, status
-from sqlmodel import SQLModel, Field, select
-from app.database import SessionDep 
+from fastapi import APIRouter, HTTPException, Response, status
+from sqlalchemy.orm import raiseload
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select
+from app.database import SessionDep, fetch_page
+from app.dependencies import AdminUser, AfterId, PageLimit, set_next_cursor_header
+from app.models.subscription import Subscription, SubscriptionBase, SubscriptionBulkCreate
 
 
 router = APIRouter(
@@ -8,9 +12,7 @@ router = APIRouter(
     tags=["subs"],
 )
 
-class Subscription(SQLModel, table=True):
-    id: int | None = Field(default=None, primary_key=True)
-    email: str = Field(min_length=1, max_length=100, description="Subscriber's email address")
+_STMT_SUBSCRIPTIONS = select(Subscription).options(raiseload("*"))
 
 
 @router.post(
@@ -20,19 +22,43 @@ class Subscription(SQLModel, table=True):
     description="Submit an email address to subscribe to the shelter's newsletter. The email will be validated and stored in the database.",
     responses={
         201: {"description": "Subscription successful"},
-        400: {"description": "Invalid input - empty email or validation errors"}
+        422: {"description": "Invalid input - empty email or validation errors"}
     }
 )
-async def subscribe(subscription: Subscription, session: SessionDep):
-    if subscription.email.strip() == "":
-        raise HTTPException(status_code=400, detail="Email cannot be empty")
-
-    session.add(subscription)
+def subscribe(subscription: SubscriptionBase, session: SessionDep):
+    # Re-subscribing is not an error, so an existing email is left as is
+    session.exec(
+        insert(Subscription)
+        .values(email=subscription.email)
+        .on_conflict_do_nothing(index_elements=[Subscription.email])
+    )
     session.commit()
-    session.refresh(subscription)
     return {"success": "Subscription successful"}
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    summary="Import newsletter subscriptions",
+    description="Store many subscriber emails with a single multi-row INSERT and one commit. Emails that are already subscribed are skipped. Requires admin privileges.",
+    responses={
+        201: {"description": "Subscriptions imported"},
+        422: {"description": "One or more emails are empty or too long"},
+        401: {"description": "Unauthorized - Invalid or missing token"},
+        403: {"description": "Forbidden - Admin privileges required"}
+    }
+)
+def subscribe_bulk(bulk: SubscriptionBulkCreate, session: SessionDep, admin: AdminUser):
+    inserted = session.exec(
+        insert(Subscription)
+        .values([{"email": email} for email in bulk.emails])
+        .on_conflict_do_nothing(index_elements=[Subscription.email])
+        .returning(Subscription.id)
+    ).all()
+    session.commit()
+    return {"success": "Subscriptions imported successfully", "count": len(inserted)}
+
+
 @router.get(
   "/",
   status_code=status.HTTP_200_OK,
@@ -43,8 +69,16 @@ async def subscribe(subscription: Subscription, session: SessionDep):
     404: {"description": "No subscriptions found"}
   }
 )
-async def get_subscriptions(session: SessionDep):
-    subscriptions = session.exec(select(Subscription)).all()
-    if not subscriptions:
+def get_subscriptions(
+    session: SessionDep, response: Response, after_id: AfterId = None, limit: PageLimit = None
+):
+    if after_id is None and limit is None:
+        subscriptions = session.exec(_STMT_SUBSCRIPTIONS).all()
+    else:
+        subscriptions, next_cursor = fetch_page(session, _STMT_SUBSCRIPTIONS, Subscription.id, after_id, limit)
+        set_next_cursor_header(response, next_cursor)
+
+    # An empty page past the end of the list is not an error
+    if not subscriptions and after_id is None:
         raise HTTPException(status_code=404, detail="No subscriptions found")
     return subscriptions
\ No newline at end of file
@@ -1,32 +1,54 @@
-from datetime import timedelta
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, EmailStr, Field as PydanticField
-from sqlmodel import SQLModel, Field, select
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field as PydanticField
+from sqlalchemy import bindparam
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select, update
 from app.database import SessionDep
-from app.auth import get_password_hash, verify_password, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
-from app.dependencies import CurrentUser
+from app.auth import get_password_hash, verify_password, password_needs_rehash, create_access_token
+from app.dependencies import CurrentUser, get_or_404
+from app.models.types import CachedEmailStr
+from app.models.user import PawUser, PawUserBase
 
 router = APIRouter(
     prefix="/users",
     tags=["users"],
 )
 
-class PawUser(SQLModel, table=True):
-    """User model for authentication and authorization."""
-    id: int | None = Field(default=None, primary_key=True)
-    email: EmailStr = Field(index=True, unique=True, description="User's email address")
-    name: str = Field(min_length=1, max_length=100, description="User's first name")
-    lastName: str = Field(min_length=1, max_length=100, description="User's last name")
-    password: str = Field(min_length=8, description="Hashed password")
-    isAdmin: bool = Field(default=False, description="Whether user has admin privileges")
+# Built once with a bound parameter; each login only supplies the email
+_STMT_USER_BY_EMAIL = select(PawUser).where(PawUser.email == bindparam("email"))
 
 
 class LoginRequest(BaseModel):
     """Login credentials schema."""
-    email: EmailStr = PydanticField(description="User's email address")
+    email: CachedEmailStr = PydanticField(description="User's email address")
     password: str = PydanticField(min_length=1, description="User's password")
 
 
+# register and login stay async so password hashing can use its own executor;
+# their DB work goes through these helpers on the threadpool instead of
+# blocking the event loop.
+def get_user_by_email(session: SessionDep, email: str) -> PawUser | None:
+    return session.exec(_STMT_USER_BY_EMAIL, params={"email": email}).first()
+
+
+def insert_user(session: SessionDep, values: dict) -> int | None:
+    """Insert a user unless the email is taken; returns the new id or None."""
+    user_id = session.exec(
+        insert(PawUser)
+        .values(values)
+        .on_conflict_do_nothing(index_elements=[PawUser.email])
+        .returning(PawUser.id)
+    ).scalar_one_or_none()
+    session.commit()
+    return user_id
+
+
+def save_password_hash(session: SessionDep, user_id: int, hashed_password: str) -> None:
+    session.exec(update(PawUser).where(PawUser.id == user_id).values(password=hashed_password))
+    session.commit()
+
+
 @router.post(
     "/register",
     status_code=status.HTTP_201_CREATED,
@@ -34,28 +56,19 @@ class LoginRequest(BaseModel):
     description="Create a new user account with email and password. Password will be hashed before storage.",
     responses={
         201: {"description": "User registered successfully"},
-        400: {"description": "Invalid input data (empty fields or password too short)"},
+        422: {"description": "Invalid input data (empty fields or password too short)"},
         409: {"description": "Email already registered"}
     }
 )
-async def register_user(paw_user: PawUser, session: SessionDep):
-    existing_user = session.exec(select(PawUser).where(PawUser.email == paw_user.email)).first()
-    if existing_user:
-        raise HTTPException(status_code=409, detail="Email already registered")
-
-    for field, value in paw_user.dict().items():
-        if field == "id" or field == "isAdmin":
-            continue
-
-        if isinstance(value, str) and value.strip() == "":
-                raise HTTPException(status_code=400, detail=f"{field} cannot be empty")
-
+async def register_user(paw_user: PawUserBase, session: SessionDep):
     # Hash the password before storing it in the database
-    paw_user.password = get_password_hash(paw_user.password)
+    hashed_password = await get_password_hash(paw_user.password)
+    values = paw_user.model_dump() | {"password": hashed_password}
 
-    session.add(paw_user)
-    session.commit()
-    session.refresh(paw_user)
+    # The unique email index decides duplicates, so concurrent sign-ups with
+    # the same email can't both succeed
+    if await run_in_threadpool(insert_user, session, values) is None:
+        raise HTTPException(status_code=409, detail="Email already registered")
     return {"success": "User registered successfully"}
 
     
@@ -77,17 +90,22 @@ async def login_user(credentials: LoginRequest, session: SessionDep):
         raise HTTPException(status_code=400, detail="Email and password cannot be empty")
     
     # Find user by email
-    db_user = session.exec(select(PawUser).where(PawUser.email == credentials.email)).first()
+    db_user = await run_in_threadpool(get_user_by_email, session, credentials.email)
     
     # Verify user exists and password matches using secure hash comparison
     if not db_user:
         raise HTTPException(status_code=404, detail="User not found")  
     
-    if not verify_password(credentials.password, db_user.password):
+    if not await verify_password(credentials.password, db_user.password):
         raise HTTPException(status_code=401, detail="Invalid email or password")
+
+    # The plain password is only available here, so upgrade hashes made with
+    # older argon2 parameters now
+    if password_needs_rehash(db_user.password):
+        new_hash = await get_password_hash(credentials.password)
+        await run_in_threadpool(save_password_hash, session, db_user.id, new_hash)
     
     # Generate JWT token with user info including admin status
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={
             "sub": db_user.email,  # Subject: user identifier
@@ -95,8 +113,7 @@ async def login_user(credentials: LoginRequest, session: SessionDep):
             "isAdmin": db_user.isAdmin,
             "name": db_user.name,
             "lastName": db_user.lastName
-        },
-        expires_delta=access_token_expires
+        }
     )
     
     return {
@@ -137,10 +154,8 @@ async def get_current_user_info(current_user: CurrentUser):
         404: {"description": "User not found"}
     }
 )
-async def get_user(user_id: int, session: SessionDep):
-    user = session.get(PawUser, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+def get_user(user_id: int, session: SessionDep):
+    user = get_or_404(session, PawUser, user_id, "User not found")
     
     # Return user without password
     return {
@@ -1,57 +1,50 @@
-from typing import List
-from fastapi import APIRouter, HTTPException, status
-from pydantic import EmailStr
-from sqlmodel import SQLModel, Field, select
-from sqlalchemy import Column, String
-from sqlalchemy.dialects.postgresql import ARRAY
-from enum import Enum
-from app.database import SessionDep
-from app.dependencies import AdminUser
+from fastapi import APIRouter, HTTPException, Response, status
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload
+from sqlmodel import select, update, delete, or_
+from app.database import SessionDep, fetch_page
+from app.dependencies import AdminUser, AfterId, PageLimit, set_next_cursor_header, get_or_404
+from app.responses import stream_rows
+from app.models.volunteer import Volunteer, VolunteerBase, VolunteerSummary, VolunteerUpdate
 
 router = APIRouter(
     prefix="/volunteer",
     tags=["volunteer"],
 )
 
-class VolunteerStatus(str, Enum):
-    """Status options for volunteer applications."""
-    pending = "pending"
-    accepted = "accepted"
-    rejected = "rejected"
-
-
-class Volunteer(SQLModel, table=True):
-    """Volunteer application model for managing volunteer registrations."""
-    id: int | None = Field(default=None, primary_key=True, index=True, unique=True)
-    name: str = Field(min_length=1, max_length=100, description="Volunteer's first name")
-    lastName: str = Field(min_length=1, max_length=100, description="Volunteer's last name")
-    email: EmailStr = Field(index=True, unique=True, description="Volunteer's email address")
-    phone: str = Field(min_length=7, max_length=20, description="Volunteer's phone number")
-    availability: List[str] = Field(sa_column=Column(ARRAY(String)), description="Time availability (e.g., weekdays, weekends)")
-    availableDays: List[str] = Field(sa_column=Column(ARRAY(String)), description="Specific days available")
-    areasOfInterest: List[str] = Field(sa_column=Column(ARRAY(String)), description="Areas of interest for volunteering")
-    whyVolunteer: str = Field(min_length=10, max_length=1000, description="Reason for wanting to volunteer")
-    specialSkills: str = Field(min_length=1, max_length=500, description="Special skills or qualifications")
-    emergencyContactName: str = Field(min_length=1, max_length=100, description="Emergency contact name")
-    emergencyContactPhone: str = Field(min_length=7, max_length=20, description="Emergency contact phone number")
-    status: VolunteerStatus = Field(default=VolunteerStatus.pending, description="Application status")
-    privacyAgreement: bool = Field(default=False, description="Agreement to privacy policy")
-    date: str = Field(description="Application submission date")
-
- 
-def existing_volunteer_email(session: SessionDep, email: str) -> bool:
-    volunteer = session.exec(select(Volunteer).where(Volunteer.email == email)).first()
-    return volunteer is not None
-
-def existing_voluneer_phone(session: SessionDep, phone: str) -> bool:
-    volunteer = session.exec(select(Volunteer).where(Volunteer.phone == phone)).first()
-    return volunteer is not None
-
-def volunteer_not_found(session: SessionDep, volunteer_id: int) -> None:
-    volunteer = session.get(Volunteer, volunteer_id)
-    if not volunteer:
-        raise HTTPException(status_code=404, detail="Volunteer not found")
- 
+_STMT_VOLUNTEERS = select(Volunteer).options(raiseload("*"))
+_STMT_VOLUNTEER_SUMMARIES = select(
+    Volunteer.id, Volunteer.name, Volunteer.lastName, Volunteer.email, Volunteer.status, Volunteer.date
+)
+
+
+def volunteer_conflict(
+    session: SessionDep, email: str | None, phone: str | None, exclude_id: int | None = None
+) -> str | None:
+    """Return the 409 detail if another volunteer has this email or phone, else None.
+
+    A value of None is not checked.
+    """
+    conditions = []
+    if email is not None:
+        conditions.append(Volunteer.email == email)
+    if phone is not None:
+        conditions.append(Volunteer.phone == phone)
+    if not conditions:
+        return None
+
+    statement = select(Volunteer.email).where(or_(*conditions))
+    if exclude_id is not None:
+        statement = statement.where(Volunteer.id != exclude_id)
+    taken_email = session.exec(statement.limit(1)).first()
+    if taken_email is None:
+        return None
+    return "Email already registered" if taken_email == email else "Phone number already registered"
+
+
+def volunteer_exists(session: SessionDep, volunteer_id: int) -> bool:
+    return session.exec(select(Volunteer.id).where(Volunteer.id == volunteer_id)).first() is not None
 
 
 @router.post(
@@ -61,36 +54,60 @@ def volunteer_not_found(session: SessionDep, volunteer_id: int) -> None:
     description="Submit a new volunteer application. Email and phone must be unique. Privacy agreement must be accepted.",
     responses={
         201: {"description": "Volunteer application submitted successfully"},
-        400: {"description": "Invalid input - empty fields, missing privacy agreement, or validation errors"},
+        400: {"description": "Privacy agreement not accepted"},
+        422: {"description": "Invalid input - empty fields or validation errors"},
         409: {"description": "Email or phone number already registered"}
     }
 )
-async def create_volunteer(volunteer: Volunteer, session: SessionDep):
-
-    if existing_volunteer_email(session, volunteer.email):
-        raise HTTPException(status_code=409, detail="Email already registered")
-
-    if existing_voluneer_phone(session, volunteer.phone):
-        raise HTTPException(status_code=409, detail="Phone number already registered")
-
-    for field, value in volunteer.dict().items():
-        if field == "id" or field == "status":
-            continue
-
-        if isinstance(value, str) and value.strip() == "":
-                raise HTTPException(status_code=400, detail=f"{field} cannot be empty")
+def create_volunteer(volunteer: VolunteerBase, session: SessionDep):
+    if not volunteer.privacyAgreement:
+        raise HTTPException(status_code=400, detail="You must agree to the privacy policy")
+
+    conflict = volunteer_conflict(session, volunteer.email, volunteer.phone)
+    if conflict:
+        raise HTTPException(status_code=409, detail=conflict)
+
+    # Email and phone are unique in the table, so a concurrent duplicate that
+    # slipped past the check above is still rejected by the insert itself
+    volunteer_id = session.exec(
+        insert(Volunteer)
+        .values(volunteer.model_dump())
+        .on_conflict_do_nothing()
+        .returning(Volunteer.id)
+    ).scalar_one_or_none()
+    if volunteer_id is None:
+        conflict = volunteer_conflict(session, volunteer.email, volunteer.phone)
+        raise HTTPException(status_code=409, detail=conflict or "Email or phone number already registered")
 
-        if isinstance(value, list) and len(value) == 0:
-                raise HTTPException(status_code=400, detail=f"{field} cannot be empty")
-        
-        if field == "privacyAgreement" and value is not True:
-                raise HTTPException(status_code=400, detail="You must agree to the privacy policy")
-
-    session.add(volunteer)
     session.commit()
-    session.refresh(volunteer)
     return {"success": "Volunteer form successfully submitted"}
 
+@router.get(
+    "/summary",
+    status_code=status.HTTP_200_OK,
+    response_model=list[VolunteerSummary],
+    summary="Get volunteer summaries",
+    description="Retrieve only the fields needed for the volunteer list view, without availability, skills or emergency contacts. Use /volunteer/{volunteer_id} for full details. Requires admin privileges.",
+    responses={
+        200: {"description": "List of volunteer summaries"},
+        401: {"description": "Unauthorized - Invalid or missing token"},
+        403: {"description": "Forbidden - Admin privileges required"}
+    }
+)
+def read_volunteer_summaries(
+    session: SessionDep,
+    admin: AdminUser,
+    response: Response,
+    after_id: AfterId = None,
+    limit: PageLimit = None,
+):
+    if after_id is None and limit is None:
+        return session.exec(_STMT_VOLUNTEER_SUMMARIES).all()
+
+    rows, next_cursor = fetch_page(session, _STMT_VOLUNTEER_SUMMARIES, Volunteer.id, after_id, limit)
+    set_next_cursor_header(response, next_cursor)
+    return rows
+
 @router.get(
     "/{volunteer_id}",
     status_code=status.HTTP_200_OK,
@@ -103,9 +120,8 @@ async def create_volunteer(volunteer: Volunteer, session: SessionDep):
         404: {"description": "Volunteer not found"}
     }
 )
-async def read_volunteer(volunteer_id: int, session: SessionDep, admin: AdminUser):
-    volunteer = session.get(Volunteer, volunteer_id)
-    volunteer_not_found(session, volunteer_id)
+def read_volunteer(volunteer_id: int, session: SessionDep, admin: AdminUser):
+    volunteer = get_or_404(session, Volunteer, volunteer_id, "Volunteer not found")
     return volunteer
 
 @router.get(
@@ -119,57 +135,70 @@ async def read_volunteer(volunteer_id: int, session: SessionDep, admin: AdminUse
         403: {"description": "Forbidden - Admin privileges required"}
     }
 )
-async def read_volunteers(session: SessionDep, admin: AdminUser):
-    volunteers = session.exec(select(Volunteer)).all()
-    return {"volunteers": volunteers}
+def read_volunteers(
+    session: SessionDep,
+    admin: AdminUser,
+    response: Response,
+    after_id: AfterId = None,
+    limit: PageLimit = None,
+):
+    if after_id is not None or limit is not None:
+        volunteers, next_cursor = fetch_page(session, _STMT_VOLUNTEERS, Volunteer.id, after_id, limit)
+        set_next_cursor_header(response, next_cursor)
+        return {"volunteers": volunteers, "next_cursor": next_cursor}
+
+    return stream_rows(_STMT_VOLUNTEERS, key="volunteers")
 
 @router.put(
     "/{volunteer_id}",
     status_code=status.HTTP_200_OK,
     summary="Update volunteer application",
-    description="Update an existing volunteer's information. Email and phone uniqueness will be validated if changed. Requires admin privileges.",
+    description="Update an existing volunteer's information. Only the fields sent are changed. Email and phone uniqueness will be validated if sent. Requires admin privileges.",
     responses={
         200: {"description": "Volunteer updated successfully or no changes detected"},
-        400: {"description": "Invalid input - empty fields or validation errors"},
+        422: {"description": "Invalid input - empty fields or validation errors"},
         401: {"description": "Unauthorized - Invalid or missing token"},
         403: {"description": "Forbidden - Admin privileges required"},
         404: {"description": "Volunteer not found"},
         409: {"description": "Email or phone number already registered to another volunteer"}
     }
 )
-async def update_volunteer(volunteer_id: int, updated_volunteer: Volunteer, session: SessionDep, admin: AdminUser):
-    volunteer = session.get(Volunteer, volunteer_id)
-    volunteer_not_found(session, volunteer_id)
-
-    if volunteer.email != updated_volunteer.email:
-        if existing_volunteer_email(session, updated_volunteer.email):
-            raise HTTPException(status_code=409, detail="Email already registered")
-    
-    if volunteer.phone != updated_volunteer.phone:
-        if existing_voluneer_phone(session, updated_volunteer.phone):
-            raise HTTPException(status_code=409, detail="Phone number already registered")
-
-    changes_made = False
-    for field, value in updated_volunteer.dict().items():
-        if field == "id":
-            continue
-
-        if isinstance(value, str) and value.strip() == "":
-            raise HTTPException(status_code=400, detail=f"{field} cannot be empty")
-
-        if isinstance(value, list) and len(value) == 0:
-            raise HTTPException(status_code=400, detail=f"{field} cannot be empty")
-
-        if getattr(volunteer, field) != value:
-            setattr(volunteer, field, value) # setattr to update fields
-            changes_made = True
-        
-    if not changes_made:
+def update_volunteer(volunteer_id: int, updated_volunteer: VolunteerUpdate, session: SessionDep, admin: AdminUser):
+    # Every column is NOT NULL, so an explicit null is treated like an omitted field
+    patch = updated_volunteer.model_dump(exclude_unset=True, exclude_none=True)
+
+    conflict = volunteer_conflict(session, patch.get("email"), patch.get("phone"), exclude_id=volunteer_id)
+    if conflict:
+        # A missing volunteer is reported as such, whatever its body collides with
+        if not volunteer_exists(session, volunteer_id):
+            raise HTTPException(status_code=404, detail="Volunteer not found")
+        raise HTTPException(status_code=409, detail=conflict)
+
+    updated_id = None
+    if patch:
+        # The database compares old and new values, so an unchanged row is not written
+        try:
+            updated_id = session.exec(
+                update(Volunteer)
+                .where(
+                    Volunteer.id == volunteer_id,
+                    or_(*(getattr(Volunteer, field).is_distinct_from(value) for field, value in patch.items()))
+                )
+                .values(**patch)
+                .returning(Volunteer.id)
+            ).scalar_one_or_none()
+        except IntegrityError:
+            # A concurrent request took the email or phone after the check above
+            session.rollback()
+            raise HTTPException(status_code=409, detail="Email or phone number already registered")
+
+    if updated_id is None:
+        # Nothing was written; probe only on this path to tell 404 from no-op
+        if not volunteer_exists(session, volunteer_id):
+            raise HTTPException(status_code=404, detail="Volunteer not found")
         return {"message": "No changes detected"}
 
-    session.add(volunteer)
     session.commit()
-    session.refresh(volunteer)
 
     return {"success": "Volunteer updated successfully"}
 
@@ -185,12 +214,13 @@ async def update_volunteer(volunteer_id: int, updated_volunteer: Volunteer, sess
         404: {"description": "Volunteer not found"}
     }
 )
-async def delete_volunteer(volunteer_id: int, session: SessionDep, admin: AdminUser):
-    volunteer = session.get(Volunteer, volunteer_id)
-
-    volunteer_not_found(session, volunteer_id)
+def delete_volunteer(volunteer_id: int, session: SessionDep, admin: AdminUser):
+    deleted_id = session.exec(
+        delete(Volunteer).where(Volunteer.id == volunteer_id).returning(Volunteer.id)
+    ).scalar_one_or_none()
+    if deleted_id is None:
+        raise HTTPException(status_code=404, detail="Volunteer not found")
 
-    session.delete(volunteer)
     session.commit()
 
     return {"success": "Volunteer form deleted successfully"}
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""Gunicorn settings for production (see start.sh)."""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# One process per core plus headroom for workers blocked on I/O. Each worker
+# owns its own DB pool (see DB_POOL_SIZE / DB_MAX_OVERFLOW), so lower
+# WEB_CONCURRENCY or the pool sizes if Postgres runs out of connections.
+workers = int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1))
+
+# uvicorn[standard] ships uvloop and httptools; the worker picks them up
+# automatically when they are installed.
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Heartbeat files on tmpfs so a slow disk can't make healthy workers look hung
+worker_tmp_dir = "/dev/shm"
+
+keepalive = 5